@@ -10,9 +10,8 @@ from mla.ui import App
 if __name__ == "__main__":
     try:
         app = App()
-        if hasattr(app, 'backend') and app.backend.lang:
-            app.mainloop()
-        # If init failed, error messages were already shown
+        # Startup errors are reported (and the app exited) from within the event loop
+        app.mainloop()
     except Exception as e:
         # Catch-all for unexpected errors during App init itself
         try:
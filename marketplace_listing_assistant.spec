@@ -16,7 +16,6 @@ a = Analysis(
         'PIL',
         'PIL._tkinter_finder',
         'rembg',
-        'pyperclip',
         'ttkbootstrap',
     ],
     hookspath=[],
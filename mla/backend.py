@@ -3,11 +3,10 @@ from __future__ import annotations
 
 import os
 import queue
-import shutil
-import tempfile
 import zipfile
-from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from io import BytesIO
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
 
 from PIL import Image
 
@@ -25,6 +24,13 @@ from .exporter import save_project_output
 from .image_processing import ImageProcessor
 from .project import ProjectData
 
+# Decoding spends most of its time outside the GIL, so it scales with the cores
+_IMAGE_WORKERS = min(8, os.cpu_count() or 4)
+
+# Each processed image runs a rembg inference that is multithreaded and memory-heavy
+# on its own, so project processing is kept to a couple of images at a time
+_PROCESS_WORKERS = 2
+
 
 class Backend:
     """Backend logic for Marketplace Listing Assistant."""
@@ -45,17 +51,23 @@ class Backend:
 
         self.templates: Dict[str, Any] = config.load_templates_config()
         self.hashtag_mapping: Dict[str, Any] = config.load_hashtag_mapping_config()
+        # Bumped on every mapping save so views derived from it can be cached
+        self.hashtag_version = 0
 
         self.background_library = BackgroundLibrary()
         self.background_library.refresh()
 
         self.projects: List[ProjectData] = []
         self.current_project_index: Optional[int] = None
-        self.temp_extract_dir: Optional[str] = None
 
         self.image_processor = ImageProcessor()
 
+        # Orchestrating tasks (zip loads, processing runs) go to executor and fan their
+        # per-image work out to image_executor or process_executor, so they never wait
+        # on their own pool
         self.executor = ThreadPoolExecutor(max_workers=4)
+        self.image_executor = ThreadPoolExecutor(max_workers=_IMAGE_WORKERS)
+        self.process_executor = ThreadPoolExecutor(max_workers=_PROCESS_WORKERS)
         self.processing_queue: "queue.Queue[Any]" = queue.Queue()
         self.progress_callback: Optional[Any] = None
         self._processing_lock = threading.Lock()
@@ -142,9 +154,28 @@ class Backend:
             self.templates = templates
         return config.save_templates_config(self.templates)
 
+    def upsert_template(self, name: str, data: Dict[str, Any]) -> bool:
+        self.templates[name] = data
+        return config.save_templates_config(self.templates)
+
+    def delete_template(self, name: str) -> bool:
+        del self.templates[name]
+        return config.save_templates_config(self.templates)
+
     def save_hashtag_mapping_config(self, mapping: Optional[Dict[str, Any]] = None) -> bool:
         if mapping is not None:
             self.hashtag_mapping = mapping
+        self.hashtag_version += 1
+        return config.save_hashtag_mapping_config(self.hashtag_mapping)
+
+    def upsert_hashtag_mapping(self, tag: str, hashtags: List[str]) -> bool:
+        self.hashtag_mapping[tag] = hashtags
+        self.hashtag_version += 1
+        return config.save_hashtag_mapping_config(self.hashtag_mapping)
+
+    def delete_hashtag_mapping(self, tag: str) -> bool:
+        del self.hashtag_mapping[tag]
+        self.hashtag_version += 1
         return config.save_hashtag_mapping_config(self.hashtag_mapping)
 
     def get_available_languages(self) -> List[Tuple[str, str]]:
@@ -157,6 +188,10 @@ class Backend:
     def backgrounds(self) -> List[str]:
         return self.background_library.items
 
+    @property
+    def backgrounds_version(self) -> int:
+        return self.background_library.generation
+
     def scan_backgrounds_folder(self) -> int:
         return self.background_library.refresh()
 
@@ -178,8 +213,9 @@ class Backend:
         self.current_project_index = len(self.projects) - 1
         return project
 
-    def _load_image(self, image_path: str) -> Optional[Image.Image]:
-        return self.image_processor.load_image(image_path)
+    def _load_image(self, image_path: Union[str, BinaryIO]) -> Optional[Image.Image]:
+        processor = self.image_processor
+        return processor.load_image(image_path, processor.min_decode_size)
 
     def load_single_project_images(self, image_paths: Sequence[str]) -> Tuple[bool, List[str]]:
         if not image_paths:
@@ -202,66 +238,112 @@ class Backend:
 
         return True, errors
 
-    def load_projects_from_zip(self, zip_path: str) -> Tuple[bool, str, int, List[str]]:
+    def _load_images_parallel(
+        self,
+        sources: Sequence[Any],
+        progress_callback: Optional[Any] = None,
+        load: Optional[Any] = None,
+    ) -> List[Optional[Image.Image]]:
+        """Decode images on a worker pool, returning them in input order."""
+        load = load or self._load_image
+        results: List[Optional[Image.Image]] = [None] * len(sources)
+        total = len(sources)
+        futures = {self.image_executor.submit(load, source): i for i, source in enumerate(sources)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            if progress_callback:
+                progress_callback(done, total, f"Loading image {done}/{total}")
+        return results
+
+    @staticmethod
+    def _group_zip_projects(
+        members: Sequence[zipfile.ZipInfo],
+    ) -> List[Tuple[str, List[zipfile.ZipInfo], Optional[zipfile.ZipInfo]]]:
+        """Split archive members into (folder, images, description) per project folder."""
+        entries = []
+        for info in members:
+            parts = [part for part in info.filename.replace("\\", "/").split("/") if part not in ("", ".")]
+            if parts:
+                entries.append((parts, info))
+
+        # A single top-level folder wrapping everything holds the project folders
+        roots = {parts[0] for parts, _ in entries}
+        if len(roots) == 1 and any(len(parts) > 1 or info.is_dir() for parts, info in entries):
+            entries = [(parts[1:], info) for parts, info in entries if len(parts) > 1]
+
+        # Only files directly inside a project folder belong to it, as with os.listdir
+        folder_images: Dict[str, List[zipfile.ZipInfo]] = {}
+        descriptions: Dict[str, zipfile.ZipInfo] = {}
+        for parts, info in entries:
+            if len(parts) == 1:
+                if info.is_dir():
+                    folder_images.setdefault(parts[0], [])
+                continue
+            images = folder_images.setdefault(parts[0], [])
+            if len(parts) != 2 or info.is_dir():
+                continue
+            filename = parts[1]
+            if filename.lower().endswith((".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp")):
+                images.append(info)
+            elif filename == "description.txt":
+                descriptions[parts[0]] = info
+
+        return [(folder, images, descriptions.get(folder)) for folder, images in folder_images.items()]
+
+    def load_projects_from_zip_async(
+        self, zip_path: str, progress_callback: Optional[Any] = None
+    ) -> Future[Tuple[bool, str, int, List[str]]]:
+        return self.executor.submit(self.load_projects_from_zip, zip_path, progress_callback)
+
+    def load_projects_from_zip(
+        self, zip_path: str, progress_callback: Optional[Any] = None
+    ) -> Tuple[bool, str, int, List[str]]:
         errors: List[str] = []
         project_count = 0
         image_count = 0
 
         try:
-            self.temp_extract_dir = tempfile.mkdtemp()
+            # Members are decoded straight from the archive; nothing is written to disk
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                for member in zip_ref.namelist():
-                    member_path = os.path.normpath(os.path.join(self.temp_extract_dir, member))
-                    if not member_path.startswith(os.path.normpath(self.temp_extract_dir) + os.sep) and member_path != os.path.normpath(self.temp_extract_dir):
-                        raise ValueError(f"Zip contains unsafe path: {member}")
-                zip_ref.extractall(self.temp_extract_dir)
-
-            root_items = os.listdir(self.temp_extract_dir)
-            if len(root_items) == 1:
-                sole_item = os.path.join(self.temp_extract_dir, root_items[0])
-                projects_root = sole_item if os.path.isdir(sole_item) else self.temp_extract_dir
-            else:
-                projects_root = self.temp_extract_dir
-
-            folders = [
-                item
-                for item in os.listdir(projects_root)
-                if os.path.isdir(os.path.join(projects_root, item))
-            ]
-
-            for item in folders:
-                item_path = os.path.join(projects_root, item)
-                project = ProjectData(f"Project_{len(self.projects) + 1}")
-                images_loaded = False
-
-                desc_file = os.path.join(item_path, "description.txt")
-                if os.path.exists(desc_file):
-                    try:
-                        with open(desc_file, "r", encoding="utf-8") as handle:
-                            project.generated_description = handle.read()
-                    except Exception:
-                        pass
-
-                for filename in os.listdir(item_path):
-                    if not filename.lower().endswith((".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp")):
-                        continue
-                    img_path = os.path.join(item_path, filename)
-                    img = self._load_image(img_path)
-                    if img is None:
-                        errors.append(f"Failed to load image '{filename}' in '{item}'.")
-                        continue
-                    project.clothing_images.append({"path": img_path, "image": img})
-                    images_loaded = True
-                    image_count += 1
-
-                if images_loaded:
-                    self.projects.append(project)
-                    project_count += 1
+                folder_members = self._group_zip_projects(zip_ref.infolist())
+
+                def load_member(info: zipfile.ZipInfo) -> Optional[Image.Image]:
+                    return self._load_image(BytesIO(zip_ref.read(info)))
+
+                # Collect every image first so decoding can run in parallel across folders
+                all_members = [info for _, images, _ in folder_members for info in images]
+                decoded = iter(self._load_images_parallel(all_members, progress_callback, load_member))
+
+                for item, images, desc_info in folder_members:
+                    project = ProjectData(f"Project_{len(self.projects) + 1}")
+                    images_loaded = False
+
+                    if desc_info is not None:
+                        try:
+                            project.generated_description = zip_ref.read(desc_info).decode("utf-8")
+                        except Exception:
+                            pass
+
+                    for info in images:
+                        filename = os.path.basename(info.filename)
+                        img = next(decoded)
+                        if img is None:
+                            errors.append(f"Failed to load image '{filename}' in '{item}'.")
+                            continue
+                        # The path only labels the image, so it names the archive member
+                        img_path = os.path.join(zip_path, info.filename)
+                        project.clothing_images.append({"path": img_path, "image": img})
+                        images_loaded = True
+                        image_count += 1
+
+                    if images_loaded:
+                        self.projects.append(project)
+                        project_count += 1
 
             if project_count > 0:
                 self.current_project_index = len(self.projects) - project_count
         except Exception as exc:
-            errors.append(f"Error extracting ZIP: {exc}")
+            errors.append(f"Error reading ZIP: {exc}")
 
         if project_count == 0:
             if not errors:
@@ -301,6 +383,13 @@ class Backend:
             return None
         return self.get_project(self.current_project_index)
 
+    def get_current_project_and_index(self) -> Tuple[Optional[int], Optional[ProjectData]]:
+        """Return the current index with its project, or (None, None) when nothing is selected."""
+        index = self.current_project_index
+        if index is None or not (0 <= index < len(self.projects)):
+            return None, None
+        return index, self.projects[index]
+
     def update_project_data(self, index: int, **kwargs: Any) -> bool:
         project = self.get_project(index)
         if not project:
@@ -370,18 +459,12 @@ class Backend:
             if user_bg_path:
                 processed["user_bg_path"] = user_bg_path
                 processed["bg_path"] = user_bg_path
-                try:
-                    bg_source = Image.open(user_bg_path)
-                except Exception:
-                    bg_source = None
+                bg_source = self.image_processor.load_background(user_bg_path)
             elif not processed.get("use_solid_bg", self.use_solid_bg) and self.backgrounds:
                 best_bg = self.image_processor.find_best_background(no_bg, self.backgrounds)
                 if best_bg:
                     processed["bg_path"] = best_bg
-                    try:
-                        bg_source = Image.open(best_bg)
-                    except Exception:
-                        bg_source = None
+                    bg_source = self.image_processor.load_background(best_bg)
 
             final_img = self.image_processor.fit_clothing(
                 no_bg,
@@ -412,62 +495,50 @@ class Backend:
         errors: List[str] = []
         total_images = len(project.clothing_images)
         current_global_setting = self.use_solid_bg
+        # Workers see one snapshot even if the library changes while they run
+        backgrounds = [] if current_global_setting else list(self.backgrounds)
         cancelled = False
 
         callback = self.progress_callback
+        processed_images = project.processed_images
 
+        # Entries are created here in index order, so the workers only ever
+        # fill in their own dict and never resize processed_images
+        pending = []
         for idx, item in enumerate(project.clothing_images):
+            # Entries that already hold an up-to-date result are skipped before any setup;
+            # a missing use_solid_bg defaults to the global setting, as _ensure_processed_entry does
+            if idx < len(processed_images):
+                existing = processed_images[idx]
+                if existing.get("processed") is not None and (
+                    existing.get("individual_override", False)
+                    or existing.get("use_solid_bg", current_global_setting) == current_global_setting
+                ):
+                    continue
+            pending.append((idx, item, self._ensure_processed_entry(project, idx, False)))
+
+        done = total_images - len(pending)
+        futures = {
+            self.process_executor.submit(
+                self._process_project_image, item, processed, current_global_setting, backgrounds
+            ): idx
+            for idx, item, processed in pending
+        }
+        for future in as_completed(futures):
+            done += 1
+            exc = future.exception()
+            if exc is not None:
+                errors.append(f"Error processing image {futures[future]}: {exc}")
             if callback:
-                should_continue = callback(
-                    idx + 1, total_images, f"Processing image {idx + 1}/{total_images}"
-                )
+                should_continue = callback(done, total_images, f"Processing image {done}/{total_images}")
                 if should_continue is False:
                     cancelled = True
                     errors.append("Processing cancelled by user.")
+                    # Images already running finish before the run reports back; the rest never start
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    wait(futures)
                     break
-            try:
-                original_img = item["image"]
-                processed = self._ensure_processed_entry(project, idx, False)
-
-                needs_processing = False
-                if processed.get("processed") is None:
-                    needs_processing = True
-                elif (
-                    not processed.get("individual_override", False)
-                    and processed.get("use_solid_bg", None) != current_global_setting
-                ):
-                    needs_processing = True
-
-                if not needs_processing:
-                    continue
-
-                no_bg = self.image_processor.remove_background(original_img)
-                processed.update(ImageProcessor.default_processed_entry(item["path"], self.use_solid_bg))
-                processed["no_bg"] = no_bg
-
-                bg_source = None
-                if not self.use_solid_bg and self.backgrounds:
-                    best_bg = self.image_processor.find_best_background(no_bg, self.backgrounds)
-                    if best_bg:
-                        processed["bg_path"] = best_bg
-                        try:
-                            bg_source = Image.open(best_bg)
-                        except Exception:
-                            bg_source = None
-
-                final_img = self.image_processor.fit_clothing(
-                    no_bg,
-                    bg_source,
-                    processed["vof"],
-                    processed["hof"],
-                    processed["scale"],
-                    processed["is_horizontal"],
-                    processed.get("use_solid_bg", self.use_solid_bg),
-                    processed.get("rotation_angle", 0),
-                )
-                processed["processed"] = final_img
-            except Exception as exc:
-                errors.append(f"Error processing image {idx}: {exc}")
 
         if callback and not cancelled:
             callback(total_images, total_images, "Processing complete")
@@ -475,6 +546,36 @@ class Backend:
         self.progress_callback = None
         return (not cancelled), errors
 
+    def _process_project_image(
+        self,
+        item: Dict[str, Any],
+        processed: Dict[str, Any],
+        use_solid_bg: bool,
+        backgrounds: Sequence[str],
+    ) -> None:
+        """Remove the background of one project image and compose its result into processed."""
+        no_bg = self.image_processor.remove_background(item["image"])
+        processed.update(ImageProcessor.default_processed_entry(item["path"], use_solid_bg))
+        processed["no_bg"] = no_bg
+
+        bg_source = None
+        if not use_solid_bg and backgrounds:
+            best_bg = self.image_processor.find_best_background(no_bg, backgrounds)
+            if best_bg:
+                processed["bg_path"] = best_bg
+                bg_source = self.image_processor.load_background(best_bg)
+
+        processed["processed"] = self.image_processor.fit_clothing(
+            no_bg,
+            bg_source,
+            processed["vof"],
+            processed["hof"],
+            processed["scale"],
+            processed["is_horizontal"],
+            processed.get("use_solid_bg", use_solid_bg),
+            processed.get("rotation_angle", 0),
+        )
+
     def process_project_images(self, project_index: int) -> Tuple[bool, List[str]]:
         future = self.process_project_images_async(project_index)
         return future.result()
@@ -523,10 +624,7 @@ class Backend:
 
             bg_source = None
             if processed.get("bg_path") and not processed.get("use_solid_bg", self.use_solid_bg):
-                try:
-                    bg_source = Image.open(processed["bg_path"])
-                except Exception:
-                    bg_source = None
+                bg_source = self.image_processor.load_background(processed["bg_path"])
 
             final_img = self.image_processor.fit_clothing(
                 no_bg,
@@ -558,20 +656,5 @@ class Backend:
             return False, "Project not found", 0, 0, False
         return save_project_output(project, project_index, output_dir, self.output_prefix)
 
-    # ------------------------------------------------------------------
-    # Housekeeping
-    # ------------------------------------------------------------------
-    def cleanup_temp_dir(self) -> None:
-        if self.temp_extract_dir and os.path.exists(self.temp_extract_dir):
-            try:
-                shutil.rmtree(self.temp_extract_dir)
-            except Exception:
-                pass
-            finally:
-                self.temp_extract_dir = None
-
-    def get_cached_thumbnail(self, image_path: Any, size: Tuple[int, int] = (150, 150)) -> Image.Image:
-        return self.image_processor.get_cached_thumbnail(image_path, size)
-
 
 __all__ = ["Backend", "ProjectData", "APP_NAME"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import os
 import shutil
-from typing import List, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from . import config
 
@@ -15,6 +15,11 @@ class BackgroundLibrary:
 
     def __init__(self) -> None:
         self._backgrounds: List[str] = []
+        # Directory mtime of the last scan; adding, removing or renaming an
+        # entry updates it, so an unchanged value means the listing is current
+        self._scanned_mtime_ns: Optional[int] = None
+        # Bumped whenever the list contents change, so callers can cache derived data
+        self.generation = 0
 
     @property
     def items(self) -> List[str]:
@@ -26,9 +31,20 @@ class BackgroundLibrary:
         folder = self._get_folder_path()
         if not folder:
             self._backgrounds = []
+            self._scanned_mtime_ns = None
+            self.generation += 1
             return 0
 
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None and mtime_ns == self._scanned_mtime_ns:
+            return len(self._backgrounds)
+
         self._backgrounds = self._load_from_folder(folder)
+        self._scanned_mtime_ns = mtime_ns
+        self.generation += 1
         return len(self._backgrounds)
 
     def add_files(self, file_paths: Sequence[str]) -> Tuple[int, List[str]]:
@@ -58,6 +74,7 @@ class BackgroundLibrary:
 
                 shutil.copy2(src_path, dest_path)
                 self._backgrounds.append(dest_path)
+                self.generation += 1
                 success += 1
             except Exception as exc:
                 errors.append(f"Error copying {os.path.basename(src_path)}: {exc}")
@@ -69,13 +86,7 @@ class BackgroundLibrary:
         if not os.path.exists(folder_path):
             return 0, 0
 
-        image_files = [
-            os.path.join(folder_path, filename)
-            for filename in os.listdir(folder_path)
-            if filename.lower().endswith(SUPPORTED_IMAGE_FORMATS)
-            and os.path.isfile(os.path.join(folder_path, filename))
-        ]
-
+        image_files = self._load_from_folder(folder_path)
         success, _ = self.add_files(image_files)
         return success, 0
 
@@ -84,6 +95,7 @@ class BackgroundLibrary:
         try:
             if bg_path in self._backgrounds:
                 self._backgrounds.remove(bg_path)
+                self.generation += 1
 
             if os.path.exists(bg_path):
                 os.remove(bg_path)
@@ -100,11 +112,11 @@ class BackgroundLibrary:
     def _load_from_folder(folder_path: str) -> List[str]:
         backgrounds: List[str] = []
         try:
-            for filename in os.listdir(folder_path):
-                if filename.lower().endswith(SUPPORTED_IMAGE_FORMATS):
-                    full_path = os.path.join(folder_path, filename)
-                    if os.path.isfile(full_path):
-                        backgrounds.append(full_path)
+            # scandir reports the entry type with the listing, so most files need no extra stat
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(SUPPORTED_IMAGE_FORMATS) and entry.is_file():
+                        backgrounds.append(entry.path)
         except Exception:
             pass
         return backgrounds
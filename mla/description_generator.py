@@ -1,8 +1,9 @@
 """Description and hashtag helpers."""
 from __future__ import annotations
 
+import datetime
 import re
-from typing import Dict, Iterable
+from typing import Dict, Iterable, List
 
 from .project import ProjectData
 
@@ -14,27 +15,29 @@ def clean_hashtag(tag: str) -> str:
     return cleaned
 
 
+def _build_alias_index(hashtag_mapping: Dict[str, Iterable[str]]) -> Dict[str, List[str]]:
+    """Map every lowercased key and value to its entry's hashtags; the first key in order wins."""
+    index: Dict[str, List[str]] = {}
+    for key, values in hashtag_mapping.items():
+        mapping_values = list(values)
+        index.setdefault(key.lower(), mapping_values)
+        for value in mapping_values:
+            index.setdefault(value.lower(), mapping_values)
+    return index
+
+
 def process_hashtags(tags: Iterable[str], hashtag_mapping: Dict[str, Iterable[str]]) -> str:
     hashtags = set()
+    # One pass over the mapping instead of a linear scan per tag
+    alias_index = _build_alias_index(hashtag_mapping)
     for tag in tags:
         tag = tag.strip()
         if not tag:
             continue
 
-        found_mapping = False
-        lower_tag = tag.lower()
-        for key, values in hashtag_mapping.items():
-            mapping_values = list(values)
-            if lower_tag == key.lower() or lower_tag in (value.lower() for value in mapping_values):
-                for hashtag in mapping_values:
-                    cleaned = clean_hashtag(hashtag)
-                    if cleaned:
-                        hashtags.add(f"#{cleaned}")
-                found_mapping = True
-                break
-
-        if not found_mapping:
-            cleaned = clean_hashtag(tag)
+        mapping_values = alias_index.get(tag.lower())
+        for hashtag in mapping_values if mapping_values is not None else (tag,):
+            cleaned = clean_hashtag(hashtag)
             if cleaned:
                 hashtags.add(f"#{cleaned}")
 
@@ -83,7 +86,6 @@ def generate_description(project: ProjectData, lang: Dict[str, str], units: str,
     
     # Storage reference with emoji
     if project.owner_letter and project.storage_letter:
-        import datetime
         date_tag = datetime.datetime.now().strftime("%m%y")
         storage_tag = f"{project.owner_letter.upper()}{project.storage_letter.upper()}{date_tag}"
         if parts:
@@ -4,12 +4,13 @@ from __future__ import annotations
 import colorsys
 import hashlib
 import math
+import os
 import threading
 from io import BytesIO
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from PIL import Image
-from rembg import remove  # type: ignore
+from PIL import Image, ImageStat
+from rembg import new_session, remove  # type: ignore
 
 from .constants import (
     DEFAULT_CANVAS_HEIGHT_H,
@@ -21,7 +22,36 @@ from .constants import (
     DEFAULT_VERTICAL_OFFSET,
 )
 
-ImageLike = Union[str, Image.Image]
+# Alpha lookup table selecting the pixels that count as opaque for colour analysis
+_OPAQUE_LUT = [0] * 129 + [255] * 127
+
+# Decoded backgrounds are full-size photos, so only the most recent few are kept
+_BACKGROUND_CACHE_SIZE = 8
+
+# Each rembg inference holds large buffers of its own, so only a couple run at once
+_BG_REMOVAL_CONCURRENCY = 2
+
+
+def compute_placement(
+    cloth_size: Tuple[int, int],
+    canvas_size: Tuple[int, int],
+    vof: float,
+    hof: float,
+    scale: float,
+) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """Return the resized clothing size and its clamped paste position on the canvas."""
+    cloth_w, cloth_h = cloth_size
+    canvas_width, canvas_height = canvas_size
+
+    final_scale = min(canvas_width / cloth_w, canvas_height / cloth_h) * scale
+    new_w = max(1, int(cloth_w * final_scale))
+    new_h = max(1, int(cloth_h * final_scale))
+
+    base_x = (canvas_width - new_w) // 2
+    base_y = (canvas_height - new_h) // 2
+    final_x = max(0, min(base_x + int(hof * canvas_width), canvas_width - new_w))
+    final_y = max(0, min(base_y + int(vof * canvas_height), canvas_height - new_h))
+    return (new_w, new_h), (final_x, final_y)
 
 
 class ImageProcessor:
@@ -34,10 +64,15 @@ class ImageProcessor:
         self.canvas_height_h = DEFAULT_CANVAS_HEIGHT_H
 
         self._dominant_color_cache: Dict[Tuple[str, Tuple[int, int], bool], Tuple[int, int, int]] = {}
-        self._thumbnail_cache: Dict[Tuple[str, Tuple[int, int]], Image.Image] = {}
         self._bg_color_cache: Dict[str, Tuple[int, int, int]] = {}
+        self._background_cache: Dict[Tuple[str, int], Image.Image] = {}
         self._cache_lock = threading.Lock()
 
+        # One rembg model session shared by every worker, created on first use
+        self._rembg_session: Optional[Any] = None
+        self._session_lock = threading.Lock()
+        self._removal_slots = threading.BoundedSemaphore(_BG_REMOVAL_CONCURRENCY)
+
     # ------------------------------------------------------------------
     # Canvas configuration
     # ------------------------------------------------------------------
@@ -56,20 +91,63 @@ class ImageProcessor:
     # ------------------------------------------------------------------
     # Image loading helpers
     # ------------------------------------------------------------------
+    @property
+    def min_decode_size(self) -> int:
+        """Smallest long-side resolution a source photo is ever used at."""
+        # Background removal already works at <= 1200px, so only larger canvases raise the bar
+        return max(self.canvas_width_v, self.canvas_height_v, self.canvas_width_h, self.canvas_height_h, 1200)
+
     @staticmethod
-    def load_image(image_path: str) -> Optional[Image.Image]:
-        """Load an image from disk as RGBA."""
+    def load_image(image_path: Union[str, BinaryIO], min_size: Optional[int] = None) -> Optional[Image.Image]:
+        """Load an image from a path or file object as RGBA, letting JPEGs decode at a reduced scale down to min_size."""
         try:
-            img = Image.open(image_path)
+            with Image.open(image_path) as img:
+                if min_size:
+                    # JPEG only: decodes at 1/2, 1/4 or 1/8 scale while staying >= min_size on both sides
+                    img.draft(img.mode, (min_size, min_size))
+                img.load()
             if img.mode != "RGBA":
                 img = img.convert("RGBA")
             return img
         except Exception:
             return None
 
+    def load_background(self, bg_path: str) -> Optional[Image.Image]:
+        """Load a background image fully into memory, reusing the decode of an unchanged file."""
+        # fit_clothing only reads the background, so one decoded copy can be shared;
+        # the mtime in the key makes an edited file decode again
+        try:
+            cache_key = (bg_path, os.stat(bg_path).st_mtime_ns)
+        except OSError:
+            return None
+        with self._cache_lock:
+            cached = self._background_cache.pop(cache_key, None)
+            if cached is not None:
+                self._background_cache[cache_key] = cached
+                return cached
+
+        try:
+            with Image.open(bg_path) as img:
+                img.load()
+        except Exception:
+            return None
+
+        with self._cache_lock:
+            self._background_cache[cache_key] = img
+            while len(self._background_cache) > _BACKGROUND_CACHE_SIZE:
+                del self._background_cache[next(iter(self._background_cache))]
+        return img
+
     # ------------------------------------------------------------------
     # Background removal and colour analysis
     # ------------------------------------------------------------------
+    def _get_rembg_session(self) -> Any:
+        """Return the shared rembg session, loading the model once."""
+        with self._session_lock:
+            if self._rembg_session is None:
+                self._rembg_session = new_session()
+            return self._rembg_session
+
     def remove_background(self, pil_image: Image.Image, max_size: int = 1200) -> Image.Image:
         """Remove the background from an image using rembg."""
         try:
@@ -86,7 +164,10 @@ class ImageProcessor:
 
             buffer = BytesIO()
             pil_image.save(buffer, format="PNG")
-            output_data = remove(buffer.getvalue())
+            # Without a session rembg loads a fresh model on every call
+            session = self._get_rembg_session()
+            with self._removal_slots:
+                output_data = remove(buffer.getvalue(), session=session)
 
             result = Image.open(BytesIO(output_data))
             if result.mode != "RGBA":
@@ -117,19 +198,15 @@ class ImageProcessor:
                 image = image.convert("RGBA")
 
             small = image.resize((30, 30), Image.Resampling.LANCZOS)
-            pixels = list(small.getdata())
-            r = g = b = count = 0
-
-            for pr, pg, pb, pa in pixels:
-                if not ignore_transparent or pa > 128:
-                    r += pr
-                    g += pg
-                    b += pb
-                    count += 1
+            # Sum the channels in C via the histogram instead of looping over pixels
+            mask = small.getchannel("A").point(_OPAQUE_LUT) if ignore_transparent else None
+            stat = ImageStat.Stat(small.convert("RGB"), mask)
+            count = stat.count[0]
 
             if count == 0:
                 color = (128, 128, 128)
             else:
+                r, g, b = (int(total) for total in stat.sum)
                 color = (r // count, g // count, b // count)
 
             with self._cache_lock:
@@ -168,10 +245,10 @@ class ImageProcessor:
             bg_color = self._bg_color_cache.get(bg_path)
             if bg_color is None:
                 try:
-                    bg_image = Image.open(bg_path)
+                    with Image.open(bg_path) as bg_image:
+                        bg_color = self.compute_dominant_color(bg_image, ignore_transparent=False)
                 except Exception:
                     continue
-                bg_color = self.compute_dominant_color(bg_image, ignore_transparent=False)
                 self._bg_color_cache[bg_path] = bg_color
 
             # Find background closest to complementary color (for contrast)
@@ -249,57 +326,24 @@ class ImageProcessor:
                 clothing_cropped = clothing_image
                 cloth_w, cloth_h = clothing_image.size
 
-            scale_w = canvas_width / cloth_w
-            scale_h = canvas_height / cloth_h
-            fit_scale = min(scale_w, scale_h)
-
-            final_scale = fit_scale * scale
-            new_size = (int(cloth_w * final_scale), int(cloth_h * final_scale))
+            new_size, position = compute_placement(
+                (cloth_w, cloth_h), (canvas_width, canvas_height), vof, hof, scale
+            )
             clothing_resized = clothing_cropped.resize(new_size, Image.Resampling.LANCZOS)
-
-            base_x = (canvas_width - new_size[0]) // 2
-            base_y = (canvas_height - new_size[1]) // 2
-
-            offset_x = int(hof * canvas_width)
-            offset_y = int(vof * canvas_height)
-            final_x = max(0, min(base_x + offset_x, canvas_width - new_size[0]))
-            final_y = max(0, min(base_y + offset_y, canvas_height - new_size[1]))
-
-            canvas.paste(clothing_resized, (final_x, final_y), clothing_resized)
+            canvas.paste(clothing_resized, position, clothing_resized)
             return canvas
         except Exception:
             return Image.new("RGBA", (canvas_width, canvas_height), (200, 200, 200))
 
     # ------------------------------------------------------------------
-    # Thumbnail cache
+    # Thumbnails
     # ------------------------------------------------------------------
-    def get_cached_thumbnail(self, image: ImageLike, size: Tuple[int, int] = (150, 150)) -> Image.Image:
-        if isinstance(image, str):
-            cache_key: Tuple[str, Tuple[int, int]] = (image, size)
-        else:
-            small_for_key = image.resize((8, 8), Image.Resampling.NEAREST)
-            cache_key = (hashlib.md5(small_for_key.tobytes()).hexdigest(), size)
-
-        with self._cache_lock:
-            thumbnail = self._thumbnail_cache.get(cache_key)
-        if thumbnail is not None:
-            return thumbnail
-
-        if isinstance(image, str):
-            img = Image.open(image)
-        else:
-            img = image
-
-        thumbnail = img.copy()
-        thumbnail.thumbnail(size, Image.Resampling.LANCZOS)
-
-        with self._cache_lock:
-            self._thumbnail_cache[cache_key] = thumbnail
-            if len(self._thumbnail_cache) > 100:
-                for key in list(self._thumbnail_cache.keys())[:20]:
-                    del self._thumbnail_cache[key]
-
-        return thumbnail
+    @staticmethod
+    def _fit_within(image_size: Tuple[int, int], box: Tuple[int, int]) -> Tuple[int, int]:
+        """Return image_size scaled down to fit box, keeping aspect ratio and never enlarging."""
+        width, height = image_size
+        scale = min(box[0] / width, box[1] / height, 1.0)
+        return max(1, round(width * scale)), max(1, round(height * scale))
 
     # ------------------------------------------------------------------
     # Helpers for processed defaults
@@ -17,14 +17,207 @@ except ModuleNotFoundError as exc:  # pragma: no cover - startup dependency guar
     raise SystemExit("Please install ttkbootstrap via 'pip install ttkbootstrap'") from exc
 
 from PIL import ImageTk, Image
-import pyperclip
 import os
+import queue
+import weakref
 import sys
 import subprocess
+from bisect import bisect_right
+from functools import lru_cache
+from types import SimpleNamespace
 
 # Import the backend
 from mla.backend import Backend, ProjectData, APP_NAME
 from mla.constants import BG_DIR
+from mla.image_processing import ImageProcessor
+
+# Application root (one level up from the mla package, or the PyInstaller bundle)
+_BASE_PATH = getattr(sys, '_MEIPASS', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ICON_PATH = os.path.join(_BASE_PATH, "icon.ico") if sys.platform.startswith('win') else None
+
+# Translation keys (with English fallbacks) resolved once at startup into App.T
+_UI_STRINGS = {
+    "search_placeholder": "Search...",
+    "new_project_button": "New Project",
+    "remove_project_button": "Remove Project",
+    "add_images_button": "Add Images",
+    "load_zip_button": "Load Zip",
+    "use_solid_bg": "Use solid background color",
+    "process_images_button": "Process",
+    "generate_desc_button": "Generate",
+    "save_output_button": "Save",
+    "open_editor_button": "Settings",
+    "no_values_mandatory_hint": "*All fields are optional",
+    "images_tab": "Images & Adjustments",
+    "description_tab": "Description",
+    "clothing_type": "Clothing Type:",
+    "state": "Condition:",
+    "measurements": "Measurements:",
+    "custom_hashtags": "Custom Hashtags (#tag1, #tag2)",
+    "storage_info": "Storage Info",
+    "owner_letter": "Owner Initial:",
+    "storage_letter": "Storage Code:",
+    "tags": "Tags:",
+    "search_tags": "Search tags...",
+    "colors": "Colors:",
+    "search_colors": "Search colors...",
+    "adjustments_label": "Adjust Selected Image",
+    "background_ratio_label": "Use Horizontal (4:3) Ratio",
+    "preserve_object": "Preserve object (skip background removal)",
+    "vertical_offset_factor": "Vertical Position:",
+    "horizontal_offset_factor": "Horizontal Position:",
+    "size_scale_factor": "Size:",
+    "rotation_label": "Rotation:",
+    "copy_desc_button": "Copy Description",
+    "select_images": "Select Images",
+    "image_files": "Image Files",
+    "all_files": "All Files",
+    "warning": "Warning",
+    "load_errors": "Some images could not be loaded:\n",
+    "loading_zip": "Loading projects from archive...",
+    "no_project": "No project loaded or selected.",
+    "confirm_delete": "Confirm Deletion",
+    "confirm_remove_project": "Remove current project?",
+    "no_image_loaded": "Please upload clothing images first.",
+    "no_background": "No background images found. Please add backgrounds or enable solid color mode.",
+    "processing_title": "Processing",
+    "processing_warning": "Processing images...",
+    "cancel": "Cancel",
+    "error": "Error",
+    "copy_empty": "Description is empty.",
+    "copy_fail": "Could not copy to clipboard",
+    "no_processed_images": "No processed images exist for this project.",
+    "select_output_base_folder": "Select Folder to Save Project Output",
+    "save_summary_msg": "Saved to:\n{folder}\n\nImages OK: {img_ok}\nImages Failed: {img_err}\nDesc Saved: {desc_ok}",
+    "success": "Success",
+    "existing_clothing_types": "Existing Clothing Types:",
+    "type_name": "Type Name:",
+    "measurement_fields": "Measurement Fields (comma-separated):",
+    "default_tags": "Default Tags (Auto-selected)",
+    "add_update_button": "Save",
+    "delete_button": "Delete",
+    "new_button": "New",
+    "input_error": "Input Error",
+    "type_name_empty": "Type name empty.",
+    "type_saved_msg": "Type '{type_name}' saved.",
+    "save_failed": "Save failed.",
+    "confirm_delete_type_msg": "Delete type '{type_name}'?",
+    "deleted": "Deleted",
+    "type_deleted_msg": "Type '{type_name}' deleted.",
+    "type_not_found_msg": "Type '{type_name}' not found.",
+    "existing_tag_mappings": "Existing Tag Mappings:",
+    "tag": "Tag:",
+    "hashtags": "Hashtags (comma-separated):",
+    "tag_empty": "Tag empty.",
+    "enter_hashtags": "Enter hashtags.",
+    "tag_saved_msg": "Tag '{tag}' saved.",
+    "confirm_delete_tag_msg": "Delete tag mapping '{tag}'?",
+    "tag_deleted_msg": "Tag '{tag}' deleted.",
+    "tag_not_found_msg": "Tag '{tag}' not found.",
+    "existing_color_mappings": "Existing Color Mappings:",
+    "color_label": "Color:",
+    "color_hashtags_label": "Color Hashtags (comma separated):",
+    "color_preview": "Color Preview:",
+    "color_name_empty": "Color name empty.",
+    "color_saved_msg": "Color '{color_name}' saved.",
+    "confirm_delete_color": "Delete color '{color_name}'?",
+    "color_deleted_msg": "Color '{color_name}' deleted.",
+    "color_not_found": "Color '{color_name}' not found.",
+    "bg_folder_info": "Backgrounds are stored in the 'bg' folder next to the application",
+    "open_bg_folder_button": "Open Background Folder",
+    "refresh_bg_list": "Refresh List",
+    "solid_bg_note": "Note: The 'Use solid background color' option is available in the main interface.",
+    "loaded_backgrounds": "Loaded Backgrounds:",
+    "remove_selected_bg": "Remove Selected",
+    "open_bg_folder_error": "Could not open background folder:\n{error}",
+    "info": "Info",
+    "language_label": "Language (Requires Restart):",
+    "units": "Units:",
+    "output_prefix": "Output Filename Prefix:",
+    "canvas_dimensions": "Canvas Dimensions",
+    "vertical_canvas": "Vertical Canvas (Recommended: 600x800):",
+    "width": "Width:",
+    "height": "Height:",
+    "horizontal_canvas": "Horizontal Canvas (Recommended: 800x600):",
+    "save_all_settings": "Save All Settings",
+    "canvas_dimensions_error": "Canvas dimensions must be integers.",
+    "settings_saved": "Settings saved. Restart application to apply language change.",
+}
+
+
+def _build_translations(lang):
+    """Resolve every _UI_STRINGS key against the loaded language into a namespace."""
+    return SimpleNamespace(**{key: lang.get(key, default) for key, default in _UI_STRINGS.items()})
+
+
+# Swatch colors matched by substring against color names, in priority order
+_COLOR_SWATCHES = (
+    ("red", "#ff0000"), ("green", "#00ff00"), ("blue", "#0000ff"),
+    ("yellow", "#ffff00"), ("orange", "#ffa500"), ("purple", "#800080"),
+    ("pink", "#ffc0cb"), ("brown", "#a52a2a"), ("black", "#000000"),
+    ("white", "#ffffff"), ("grey", "#808080"), ("gray", "#808080"),
+    ("turquoise", "#40e0d0"),
+)
+
+# Hashtags are stored without "#" and with underscores for spaces
+_HASHTAG_TRANS = str.maketrans({"#": None, " ": "_"})
+
+# Editor searches rebuild whole listboxes/checkbox grids, so wait for a typing pause
+_EDITOR_FILTER_DELAY_MS = 200
+
+
+@lru_cache(maxsize=512)
+def _color_from_name(color_name):
+    """Get a hex color value from a color name."""
+    color_name = color_name.lower()
+    for key, value in _COLOR_SWATCHES:
+        if key in color_name:
+            return value
+    return "#cccccc"
+
+
+class _MatchIndex:
+    """Lowercased names joined into one string so a search scans them with str.find."""
+
+    # Never typed into a search box, so a match cannot straddle two names
+    SEPARATOR = "\0"
+
+    def __init__(self, names):
+        self.names = names
+        self.starts = []
+        offset = 0
+        for name in names:
+            self.starts.append(offset)
+            offset += len(name) + 1
+        self.joined = self.SEPARATOR.join(names)
+        self._last_term = None
+        self._last_found = None
+
+    def find(self, term):
+        """Return the indices of the names containing term, in order."""
+        last_term = self._last_term
+        # Every name containing term also contains any substring of it, so a
+        # refined query only needs to recheck the previous hits
+        if last_term and last_term in term:
+            names = self.names
+            found = [idx for idx in self._last_found if term in names[idx]]
+        else:
+            found = self._scan(term)
+        self._last_term, self._last_found = term, found
+        return found
+
+    def _scan(self, term):
+        joined, starts = self.joined, self.starts
+        found = []
+        pos = joined.find(term)
+        while pos != -1:
+            idx = bisect_right(starts, pos) - 1
+            found.append(idx)
+            # Resume at the next name; one hit per name is enough
+            if idx + 1 >= len(starts):
+                break
+            pos = joined.find(term, starts[idx + 1])
+        return found
 
 
 class App(ttk.Window):
@@ -42,31 +235,59 @@ class App(ttk.Window):
         self._apply_theme_overrides()
         self._suppress_events = False
         self._slider_apply_job = None
+        self._scrollbar_visible = {}
+        self._dirty_canvases = {}
+        self._canvas_flush_job = None
+        # Scrollable widgets the global mousewheel handler routes to
+        self._mousewheel_widgets = weakref.WeakSet()
+        self._search_cache = {}
+        self._search_index_last = None
+        self._visible_checkbuttons = {}
+        self._checkbutton_cells = {}
+        self._debounce_jobs = {}
+        self._pending_refreshes = set()
+        self._refresh_job = None
+        self._hashtag_partition_version = None
+        self._hashtag_partition_cache = ([], [])
+        self._last_form_signature = None
+        self._thumb_cache = {}
+        self._thumb_cache_owner = None
+        self._last_filter_key = {}
+        self._checkbutton_match_index = {}
+        self._bg_choices_sig = None
+        self._bg_choices_cache = ((None,), frozenset((None,)))
+        self._clothing_type_options = None
+        self._measurement_fields = ()
+        # Cleared after a failed iconbitmap so later windows don't retry the icon
+        self._icon_path = _ICON_PATH
         
         # Set icon for main window
         self._set_window_icon(self)
 
         try:
             self.backend = Backend()
-            # Handle critical initialization errors if any
-            if hasattr(self.backend, 'initialization_error') and self.backend.initialization_error:
-                messagebox.showerror(
-                    self.backend.lang.get("critical_error_title", "Critical Error"),
-                    self.backend.initialization_error
-                )
-                self.destroy()
-                sys.exit(1)
-
-            self.lang = self.backend.lang
-            if hasattr(self.backend, 'initialization_warning') and self.backend.initialization_warning:
-                messagebox.showwarning(
-                    self.lang.get("warning", "Warning"),
-                    self.backend.initialization_warning
-                )
         except Exception as e:
-            messagebox.showerror("Startup Error", f"Failed to initialize application:\n{e}")
-            self.destroy()
-            sys.exit(1)
+            self._abort_startup("Startup Error", f"Failed to initialize application:\n{e}")
+            return
+
+        # Handle critical initialization errors if any
+        if hasattr(self.backend, 'initialization_error') and self.backend.initialization_error:
+            self._abort_startup(
+                self.backend.lang.get("critical_error_title", "Critical Error"),
+                self.backend.initialization_error
+            )
+            return
+
+        self.lang = self.backend.lang
+        self.T = _build_translations(self.lang)
+        self._search_placeholder_lc = self.T.search_placeholder.lower()
+        if hasattr(self.backend, 'initialization_warning') and self.backend.initialization_warning:
+            # Shown once the event loop is running and the main window exists
+            self.after(0, lambda: messagebox.showwarning(
+                self.lang.get("warning", "Warning"),
+                self.backend.initialization_warning,
+                parent=self
+            ))
 
         self.title(self.lang.get("app_title", APP_NAME))
         if sys.platform.startswith('win'):
@@ -75,27 +296,50 @@ class App(ttk.Window):
             self.attributes('-zoomed', True)  # Maximize on Linux/others
 
         self.proc_image_widgets = []
+        self.proc_widget_by_index = {}
+        self._unprocessed_item_widgets = []
         self.selected_processed_index = None
-        self.tag_vars = {}
         self.tag_checkbuttons = {}
-        self.color_vars = {}
+        self._selected_tag_set = set()
         self.color_checkbuttons = {}
+        self._selected_color_set = set()
         self.measurement_entries = {}
         self.editor_window = None
         self.type_listbox = None
         self.tag_editor_listbox = None
         self.color_editor_listbox = None
-        self.editor_type_tag_vars = {}
-        self.editor_type_tag_checkbuttons = {}
+        self._editor_bg_paths = {}
+        self._last_selected_type = None
+        self._last_selected_tag = None
+        self._last_selected_color = None
+        self._editor_type_tags = []
+        self._editor_type_tags_visible = []
+        self._editor_type_defaults = set()
+        self._editor_tag_pool = []
+        self._editor_tag_slots = []
+        self._editor_tag_row_h = None
+        self._editor_type_tags_shown = False
 
         self._create_main_gui()
         self.protocol("WM_DELETE_WINDOW", self._on_app_close)
+        self.bind_all("<MouseWheel>", self._on_mousewheel)
 
         # Don't automatically create first project - start with 0 projects
 
         self._update_project_label()
         self.refresh_all_displays()
 
+    def _abort_startup(self, title, message):
+        """Hide the window and report a fatal startup error from the event loop."""
+        self.withdraw()
+        self.after(0, self._show_startup_error, title, message)
+
+    def _show_startup_error(self, title, message):
+        """Show a fatal startup error and exit the application."""
+        messagebox.showerror(title, message)
+        self.destroy()
+        sys.exit(1)
+
     def _apply_theme_overrides(self):
         """Set up a cohesive visual palette and shared widget styles."""
         self.palette = {
@@ -122,6 +366,7 @@ class App(ttk.Window):
         }
         self.configure(background=self.palette["surface"])
         style = self._style
+        self.placeholder_entry_style = "Placeholder.TEntry"
 
         # Replace ttkbootstrap's named palette so every bootstyled widget
         # (buttons, entries, sliders, round-toggle, combobox) inherits our
@@ -192,6 +437,9 @@ class App(ttk.Window):
             lightcolor=[("focus", self.palette["accent"])],
             darkcolor=[("focus", self.palette["accent"])],
         )
+        # Entries showing placeholder text swap to this style instead of
+        # reconfiguring their foreground option.
+        style.configure(self.placeholder_entry_style, foreground="grey")
 
         # Combobox: same treatment + cyan dropdown arrow.
         style.configure(
@@ -303,7 +551,7 @@ class App(ttk.Window):
     # ====================== WINDOW LIFECYCLE ======================
     def _on_app_close(self):
         """Handle application closing: cleanup and destroy."""
-        self.backend.cleanup_temp_dir()
+        self._clear_image_widgets()
         self.destroy()
 
     # ====================== MAIN GUI STRUCTURE ======================
@@ -330,6 +578,7 @@ class App(ttk.Window):
 
     def _create_top_toolbar(self):
         """Create the top toolbar with action buttons."""
+        T = self.T
         top_frame = ttk.Frame(self, padding="6 6 6 6", style=self.toolbar_style)
         top_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
 
@@ -347,7 +596,7 @@ class App(ttk.Window):
         
         ttk.Button(
             nav_frame,
-            text=self.lang.get("new_project_button", "New Project"),
+            text=T.new_project_button,
             command=self.ui_add_new_project,
             **self._button_options("secondary"),
         ).grid(row=0, column=0, padx=4)
@@ -375,7 +624,7 @@ class App(ttk.Window):
         
         ttk.Button(
             nav_frame,
-            text=self.lang.get("remove_project_button", "Remove Project"),
+            text=T.remove_project_button,
             command=self.ui_remove_current_project,
             **self._button_options("danger"),
         ).grid(row=0, column=4, padx=4)
@@ -390,14 +639,14 @@ class App(ttk.Window):
 
         ttk.Button(
             file_ops_frame,
-            text=self.lang.get("add_images_button", "Add Images"),
+            text=T.add_images_button,
             command=self.ui_load_single_project_images,
             **self._button_options("cta"),
         ).grid(row=0, column=0, padx=4)
 
         ttk.Button(
             file_ops_frame,
-            text=self.lang.get("load_zip_button", "Load Zip"),
+            text=T.load_zip_button,
             command=self.ui_load_projects_zip,
             **self._button_options("secondary"),
         ).grid(row=0, column=1, padx=4)
@@ -413,7 +662,7 @@ class App(ttk.Window):
         self.global_use_solid_bg_var = tk.BooleanVar(value=self.backend.use_solid_bg)
         ttk.Checkbutton(
             process_frame,
-            text=self.lang.get("use_solid_bg", "Use solid background color"),
+            text=T.use_solid_bg,
             variable=self.global_use_solid_bg_var,
             command=self._on_global_use_solid_bg_change,
             bootstyle="primary round-toggle",
@@ -421,21 +670,21 @@ class App(ttk.Window):
 
         ttk.Button(
             process_frame,
-            text=self.lang.get("process_images_button", "Process"),
+            text=T.process_images_button,
             command=self.ui_process_current_project_images,
             **self._button_options("cta"),
         ).grid(row=0, column=1, padx=4)
 
         ttk.Button(
             process_frame,
-            text=self.lang.get("generate_desc_button", "Generate"),
+            text=T.generate_desc_button,
             command=self.ui_generate_current_description,
             **self._button_options("primary"),
         ).grid(row=0, column=2, padx=4)
 
         ttk.Button(
             process_frame,
-            text=self.lang.get("save_output_button", "Save"),
+            text=T.save_output_button,
             command=self.ui_save_current_project_output,
             **self._button_options("success"),
         ).grid(row=0, column=3, padx=4)
@@ -443,7 +692,7 @@ class App(ttk.Window):
         # Settings (Far Right)
         ttk.Button(
             top_frame,
-            text=self.lang.get("open_editor_button", "Settings"),
+            text=T.open_editor_button,
             command=self.open_editor_window,
             **self._button_options("link"),
         ).grid(row=0, column=5, sticky="e", padx=(10, 0))
@@ -468,7 +717,7 @@ class App(ttk.Window):
         
         self.hint_label = ttk.Label(
             left_container, 
-            text=self.lang.get("no_values_mandatory_hint", "*All fields are optional"), 
+            text=self.T.no_values_mandatory_hint, 
             anchor="w",
             style="Hint.TLabel",
         )
@@ -489,50 +738,128 @@ class App(ttk.Window):
         
         self.notebook.add(
             self.images_tab_frame, 
-            text=self.lang.get("images_tab", "Images & Adjustments")
+            text=self.T.images_tab
         )
         self.notebook.add(
             self.description_tab_frame, 
-            text=self.lang.get("description_tab", "Description")
+            text=self.T.description_tab
         )
         
         self._create_images_tab(self.images_tab_frame)
         self._create_description_tab(self.description_tab_frame)
 
-    # ====================== CANVAS HELPERS ======================
-    def _on_frame_configure(self, canvas):
-        """Update canvas scrollregion when the frame changes size."""
-        canvas.update_idletasks()
-        bbox = canvas.bbox("all")
-        canvas.configure(scrollregion=bbox)
-        
-        # Show/hide scrollbar based on content height
-        content_height = (bbox[3] - bbox[1]) if bbox else 0
-        canvas_height = canvas.winfo_height()
-        scrollbar = canvas.master.children.get('!scrollbar')
-        if scrollbar:
-            if content_height <= canvas_height:
-                scrollbar.grid_remove()
-            else:
-                scrollbar.grid()
-
-    def _on_canvas_configure(self, canvas, frame_id):
-        """Update the canvas item width when the canvas is resized."""
-        if canvas and frame_id:
-            canvas.itemconfig(frame_id, width=canvas.winfo_width())
-            self._on_frame_configure(canvas)
+    # ====================== DEBOUNCE HELPERS ======================
+    def _debounce(self, key, delay, callback, *args):
+        """Run callback after delay ms, restarting the timer on each call with the same key."""
+        job = self._debounce_jobs.pop(key, None)
+        if job is not None:
+            self.after_cancel(job)
+        self._debounce_jobs[key] = self.after(delay, self._run_debounced, key, callback, args)
+
+    def _run_debounced(self, key, callback, args):
+        """Execute a debounced callback once its quiet period has elapsed."""
+        self._debounce_jobs.pop(key, None)
+        callback(*args)
+
+    def _cancel_debounce(self, key):
+        """Drop a pending debounced callback without running it."""
+        job = self._debounce_jobs.pop(key, None)
+        if job is not None:
+            self.after_cancel(job)
+
+    def _schedule_refresh(self, *names):
+        """Queue named display refreshes to run once together on the next idle cycle."""
+        self._pending_refreshes.update(names)
+        if self._refresh_job is None:
+            self._refresh_job = self.after_idle(self._flush_refreshes)
+
+    def _flush_refreshes(self):
+        """Run each queued refresh once, in dependency order."""
+        self._refresh_job = None
+        pending, self._pending_refreshes = self._pending_refreshes, set()
+        # The left panel refresh rebuilds the clothing type options itself, and
+        # refreshing the type listbox reselects a type and so its tag checkboxes
+        if "left_controls" in pending:
+            pending.discard("clothing_types")
+        if "type_listbox" in pending:
+            pending.discard("type_editor")
+        if "type_editor" in pending and not (self.editor_window and self.editor_default_tags_frame.winfo_exists()):
+            pending.discard("type_editor")
+        for name, refresh in (
+            ("type_listbox", self._editor_refresh_type_listbox),
+            ("tag_listbox", self._editor_refresh_tag_listbox),
+            ("color_listbox", self._editor_refresh_color_listbox),
+            ("tag_checkboxes", self._create_tag_checkboxes),
+            ("color_checkboxes", self._create_color_checkboxes),
+            ("clothing_types", self._update_clothing_type_options),
+            ("left_controls", self.refresh_left_controls_display),
+            ("type_editor", self._editor_on_type_select),
+            ("bg_indicators", self._refresh_background_indicators),
+        ):
+            if name in pending:
+                refresh()
 
-    def _bind_mousewheel(self, widget):
-        """Bind mousewheel events to the widget."""
-        widget.bind_all("<MouseWheel>", lambda e, w=widget: self._on_mousewheel(e, w), add="+")
+    # ====================== CANVAS HELPERS ======================
+    def _mark_canvas_dirty(self, canvas, frame_id=None, scrollbar=None, scroll_to_top=False):
+        """Queue a canvas for a layout refresh on the next idle cycle."""
+        pending = self._dirty_canvases.get(canvas)
+        if pending:
+            frame_id = frame_id or pending[0]
+            scrollbar = scrollbar or pending[1]
+            scroll_to_top = scroll_to_top or pending[2]
+        self._dirty_canvases[canvas] = (frame_id, scrollbar, scroll_to_top)
+        if self._canvas_flush_job is None:
+            self._canvas_flush_job = self.after_idle(self._flush_scrollregions)
+
+    def _flush_scrollregions(self):
+        """Update item width, scrollregion and scrollbar of every queued canvas once."""
+        self._canvas_flush_job = None
+        dirty, self._dirty_canvases = self._dirty_canvases, {}
+        for canvas, (frame_id, scrollbar, scroll_to_top) in dirty.items():
+            if not canvas.winfo_exists():
+                continue
+            if frame_id:
+                canvas.itemconfig(frame_id, width=canvas.winfo_width())
+            bbox = canvas.bbox("all")
+            canvas.configure(scrollregion=bbox)
+            if scroll_to_top:
+                canvas.yview_moveto(0)
+            if scrollbar is None:
+                continue
+
+            # Show/hide scrollbar based on content height, touching the
+            # geometry manager only when the visibility actually changes
+            content_height = (bbox[3] - bbox[1]) if bbox else 0
+            visible = content_height > canvas.winfo_height()
+            if self._scrollbar_visible.get(scrollbar) != visible:
+                self._scrollbar_visible[scrollbar] = visible
+                if visible:
+                    scrollbar.grid()
+                else:
+                    scrollbar.grid_remove()
 
-    def _unbind_mousewheel(self):
-        """Unbind mousewheel events."""
-        self.unbind_all("<MouseWheel>")
+    def _on_frame_configure(self, canvas, scrollbar=None):
+        """Schedule a scrollregion update when the inner frame changes size."""
+        self._mark_canvas_dirty(canvas, scrollbar=scrollbar)
 
-    def _on_mousewheel(self, event, widget):
-        """Handle mousewheel scrolling for a widget."""
-        if widget is None or not widget.winfo_exists():
+    def _on_canvas_configure(self, canvas, frame_id, scrollbar=None):
+        """Schedule an inner item width update when the canvas is resized."""
+        if canvas and frame_id:
+            self._mark_canvas_dirty(canvas, frame_id, scrollbar)
+
+    def _register_mousewheel(self, widget):
+        """Let the mousewheel scroll a widget while the pointer is over it or its children."""
+        self._mousewheel_widgets.add(widget)
+
+    def _on_mousewheel(self, event):
+        """Handle mousewheel scrolling for the registered widget under the pointer."""
+        # Walk up from the widget under the pointer to the nearest scrollable;
+        # some Tk-internal widgets only report their path name here
+        widget = event.widget
+        registered = self._mousewheel_widgets
+        while isinstance(widget, tk.Misc) and widget not in registered:
+            widget = widget.master
+        if not isinstance(widget, tk.Misc):
             return
             
         scroll_delta = int(-1 * (event.delta / 120))
@@ -547,6 +874,7 @@ class App(ttk.Window):
     # ====================== LEFT PANEL CONTROLS ======================
     def _create_left_controls(self, parent):
         """Create the form controls for the left panel."""
+        T = self.T
         parent.grid_columnconfigure(0, weight=1)
         
         # Configure row weights for proper distribution
@@ -564,7 +892,7 @@ class App(ttk.Window):
         # Clothing Type
         type_frame = ttk.Labelframe(
             parent,
-            text=self.lang.get("clothing_type", "Clothing Type:"),
+            text=T.clothing_type,
             style=self.card_style,
         )
         type_frame.grid(row=row_index, column=0, sticky="ew", pady=(0, 3))
@@ -580,7 +908,7 @@ class App(ttk.Window):
         # Condition/State
         state_frame = ttk.Labelframe(
             parent,
-            text=self.lang.get("state", "Condition:"),
+            text=T.state,
             style=self.card_style,
         )
         state_frame.grid(row=row_index, column=0, sticky="ew", pady=(0, 3))
@@ -588,13 +916,13 @@ class App(ttk.Window):
         
         self.state_entry = ttk.Entry(state_frame)
         self.state_entry.grid(row=0, column=0, sticky="ew")
-        self.state_entry.bind("<KeyRelease>", lambda e: self._save_current_form_to_backend())
+        self.state_entry.bind("<KeyRelease>", self._on_form_key)
         row_index += 1
         
         # Measurements
         self.measurement_lframe = ttk.Labelframe(
             parent,
-            text=self.lang.get("measurements", "Measurements:"),
+            text=T.measurements,
             style=self.card_style,
         )
         self.measurement_lframe.grid(row=row_index, column=0, sticky="ew", pady=(0, 3))
@@ -604,7 +932,7 @@ class App(ttk.Window):
         # Custom Hashtags
         custom_frame = ttk.Labelframe(
             parent,
-            text=self.lang.get("custom_hashtags", "Custom Hashtags (#tag1, #tag2)"),
+            text=T.custom_hashtags,
             style=self.card_style,
         )
         custom_frame.grid(row=row_index, column=0, sticky="ew", pady=(0, 3))
@@ -612,7 +940,7 @@ class App(ttk.Window):
         
         self.custom_hashtags_entry = ttk.Entry(custom_frame)
         self.custom_hashtags_entry.grid(row=0, column=0, sticky="ew")
-        self.custom_hashtags_entry.bind("<KeyRelease>", lambda e: self._save_current_form_to_backend())
+        self.custom_hashtags_entry.bind("<KeyRelease>", self._on_form_key)
         row_index += 1
         
         # Tags - expandable with internal scrolling
@@ -626,30 +954,30 @@ class App(ttk.Window):
         # Storage Info
         storage_frame = ttk.Labelframe(
             parent,
-            text=self.lang.get("storage_info", "Storage Info"),
+            text=T.storage_info,
             style=self.card_style,
         )
         storage_frame.grid(row=row_index, column=0, sticky="ew", pady=(0, 3))
         storage_frame.grid_columnconfigure(1, weight=1)
         storage_frame.grid_columnconfigure(3, weight=1)
 
-        ttk.Label(storage_frame, text=self.lang.get("owner_letter", "Owner Initial:")).grid(
+        ttk.Label(storage_frame, text=T.owner_letter).grid(
             row=0, column=0, sticky="w", padx=(0, 5))
         self.owner_entry = ttk.Entry(storage_frame, width=6)
         self.owner_entry.grid(row=0, column=1, sticky="w", padx=(0, 12), pady=2)
-        self.owner_entry.bind("<KeyRelease>", lambda e: self._save_current_form_to_backend())
+        self.owner_entry.bind("<KeyRelease>", self._on_form_key)
 
-        ttk.Label(storage_frame, text=self.lang.get("storage_letter", "Storage Code:")).grid(
+        ttk.Label(storage_frame, text=T.storage_letter).grid(
             row=0, column=2, sticky="w", padx=(0, 5))
         self.storage_entry = ttk.Entry(storage_frame, width=6)
         self.storage_entry.grid(row=0, column=3, sticky="w", pady=2)
-        self.storage_entry.bind("<KeyRelease>", lambda e: self._save_current_form_to_backend())
+        self.storage_entry.bind("<KeyRelease>", self._on_form_key)
 
     def _create_tags_section(self, parent, row_idx):
         """Create the tags selection section with search and checkboxes."""
         tags_frame = ttk.Labelframe(
             parent,
-            text=self.lang.get("tags", "Tags:"),
+            text=self.T.tags,
             style=self.card_style,
         )
         tags_frame.grid(row=row_idx, column=0, sticky="nsew", pady=(0, 3))
@@ -660,8 +988,8 @@ class App(ttk.Window):
         self.tag_search_var = tk.StringVar()
         self.tag_search_entry = ttk.Entry(tags_frame, textvariable=self.tag_search_var)
         self.tag_search_entry.grid(row=0, column=0, sticky="ew", pady=(0, 5))
-        self._add_placeholder(self.tag_search_entry, self.lang.get("search_tags", "Search tags..."))
-        self.tag_search_var.trace('w', lambda *args: self._filter_tags_display())
+        self._add_placeholder(self.tag_search_entry, self.T.search_tags)
+        self.tag_search_var.trace('w', lambda *args: self._debounce("tag_filter", 60, self._filter_tags_display, args))
         
         # Container for canvas with fixed height
         canvas_container = ttk.Frame(tags_frame, style=self.card_frame_style)
@@ -683,18 +1011,17 @@ class App(ttk.Window):
         self.tags_check_container_id = self.tags_canvas.create_window((0, 0), window=self.tags_check_container, anchor="nw")
         
         # Bind events for proper scrolling
-        self.tags_check_container.bind("<Configure>", lambda e: self.tags_canvas.configure(scrollregion=self.tags_canvas.bbox("all")))
-        self.tags_canvas.bind("<Configure>", lambda e: self.tags_canvas.itemconfig(self.tags_check_container_id, width=e.width))
+        self.tags_check_container.bind("<Configure>", lambda e: self._on_frame_configure(self.tags_canvas))
+        self.tags_canvas.bind("<Configure>", lambda e: self._on_canvas_configure(self.tags_canvas, self.tags_check_container_id))
         
         # Mouse wheel binding for scrolling
-        self.tags_canvas.bind("<Enter>", lambda e: self._bind_mousewheel(self.tags_canvas))
-        self.tags_canvas.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        self._register_mousewheel(self.tags_canvas)
 
     def _create_colors_section(self, parent, row_idx):
         """Create the colors selection section with search and checkboxes."""
         colors_frame = ttk.Labelframe(
             parent,
-            text=self.lang.get("colors", "Colors:"),
+            text=self.T.colors,
             style=self.card_style,
         )
         colors_frame.grid(row=row_idx, column=0, sticky="nsew", pady=(0, 3))
@@ -705,8 +1032,8 @@ class App(ttk.Window):
         self.color_search_var = tk.StringVar()
         self.color_search_entry = ttk.Entry(colors_frame, textvariable=self.color_search_var)
         self.color_search_entry.grid(row=0, column=0, sticky="ew", pady=(0, 5))
-        self._add_placeholder(self.color_search_entry, self.lang.get("search_colors", "Search colors..."))
-        self.color_search_var.trace('w', lambda *args: self._filter_colors_display())
+        self._add_placeholder(self.color_search_entry, self.T.search_colors)
+        self.color_search_var.trace('w', lambda *args: self._debounce("color_filter", 60, self._filter_colors_display, args))
         
         # Container for canvas with fixed height
         canvas_container = ttk.Frame(colors_frame, style=self.card_frame_style)
@@ -728,12 +1055,11 @@ class App(ttk.Window):
         self.colors_check_container_id = self.colors_canvas.create_window((0, 0), window=self.colors_check_container, anchor="nw")
         
         # Bind events for proper scrolling
-        self.colors_check_container.bind("<Configure>", lambda e: self.colors_canvas.configure(scrollregion=self.colors_canvas.bbox("all")))
-        self.colors_canvas.bind("<Configure>", lambda e: self.colors_canvas.itemconfig(self.colors_check_container_id, width=e.width))
+        self.colors_check_container.bind("<Configure>", lambda e: self._on_frame_configure(self.colors_canvas))
+        self.colors_canvas.bind("<Configure>", lambda e: self._on_canvas_configure(self.colors_canvas, self.colors_check_container_id))
         
         # Mouse wheel binding for scrolling
-        self.colors_canvas.bind("<Enter>", lambda e: self._bind_mousewheel(self.colors_canvas))
-        self.colors_canvas.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        self._register_mousewheel(self.colors_canvas)
 
     # ====================== IMAGES TAB ======================
     def _create_images_tab(self, parent):
@@ -742,10 +1068,10 @@ class App(ttk.Window):
         parent.grid_columnconfigure(0, weight=1)
         
         self.img_canvas = tk.Canvas(parent, borderwidth=0, highlightthickness=0, bg=self.palette["panel"])
-        img_scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.img_canvas.yview)
-        self.img_canvas.configure(yscrollcommand=img_scrollbar.set)
+        self.img_scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.img_canvas.yview)
+        self.img_canvas.configure(yscrollcommand=self.img_scrollbar.set)
         self.img_canvas.grid(row=0, column=0, sticky="nsew", pady=(0, 5))
-        img_scrollbar.grid(row=0, column=1, sticky="ns", pady=(0, 5))
+        self.img_scrollbar.grid(row=0, column=1, sticky="ns", pady=(0, 5))
 
         self.img_display_frame = ttk.Frame(self.img_canvas, padding="5", style=self.panel_style)
         self.img_display_frame_id = self.img_canvas.create_window((0, 0), window=self.img_display_frame, anchor="nw")
@@ -753,10 +1079,9 @@ class App(ttk.Window):
         self.img_display_frame.columnconfigure(0, weight=1)
         
         # Bind events
-        self.img_display_frame.bind("<Configure>", lambda e: self._on_frame_configure(self.img_canvas))
-        self.img_canvas.bind("<Configure>", lambda e: self._on_canvas_configure(self.img_canvas, self.img_display_frame_id))
-        self.img_canvas.bind("<Enter>", lambda e: self._bind_mousewheel(self.img_canvas))
-        self.img_canvas.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        self.img_display_frame.bind("<Configure>", lambda e: self._on_frame_configure(self.img_canvas, self.img_scrollbar))
+        self.img_canvas.bind("<Configure>", lambda e: self._on_canvas_configure(self.img_canvas, self.img_display_frame_id, self.img_scrollbar))
+        self._register_mousewheel(self.img_canvas)
         
         self._create_adjustment_controls(parent)
 
@@ -812,9 +1137,10 @@ class App(ttk.Window):
 
     def _create_adjustment_controls(self, parent):
         """Create the image adjustment controls."""
+        T = self.T
         adj_frame = ttk.Labelframe(
             parent,
-            text=self.lang.get("adjustments_label", "Adjust Selected Image"),
+            text=T.adjustments_label,
             style=self.card_style,
         )
         adj_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(5, 0))
@@ -825,7 +1151,7 @@ class App(ttk.Window):
         self.bg_ratio_var = tk.BooleanVar()
         bg_ratio_check = ttk.Checkbutton(
             adj_frame,
-            text=self.lang.get("background_ratio_label", "Use Horizontal (4:3) Ratio"),
+            text=T.background_ratio_label,
             variable=self.bg_ratio_var,
             command=self._on_checkbox_change
         )
@@ -836,7 +1162,7 @@ class App(ttk.Window):
         self.skip_bg_removal_var = tk.BooleanVar(value=False)
         skip_bg_check = ttk.Checkbutton(
             adj_frame,
-            text=self.lang.get("preserve_object", "Preserve object (skip background removal)"),
+            text=T.preserve_object,
             variable=self.skip_bg_removal_var,
             command=self._on_checkbox_change
         )
@@ -847,7 +1173,7 @@ class App(ttk.Window):
         self.item_use_solid_bg_var = tk.BooleanVar(value=False)
         solid_bg_check = ttk.Checkbutton(
             adj_frame,
-            text=self.lang.get("use_solid_bg", "Use solid background color"),
+            text=T.use_solid_bg,
             variable=self.item_use_solid_bg_var,
             command=self._on_checkbox_change
         )
@@ -855,7 +1181,7 @@ class App(ttk.Window):
         row += 1
         
         # Vertical position slider
-        ttk.Label(adj_frame, text=self.lang.get("vertical_offset_factor", "Vertical Position:")).grid(
+        ttk.Label(adj_frame, text=T.vertical_offset_factor).grid(
             row=row, column=0, sticky="w", pady=1
         )
         self.slider_vof = ttk.Scale(
@@ -873,7 +1199,7 @@ class App(ttk.Window):
         row += 1
 
         # Horizontal position slider
-        ttk.Label(adj_frame, text=self.lang.get("horizontal_offset_factor", "Horizontal Position:")).grid(
+        ttk.Label(adj_frame, text=T.horizontal_offset_factor).grid(
             row=row, column=0, sticky="w", pady=1
         )
         self.slider_hof = ttk.Scale(
@@ -891,7 +1217,7 @@ class App(ttk.Window):
         row += 1
 
         # Size slider
-        ttk.Label(adj_frame, text=self.lang.get("size_scale_factor", "Size:")).grid(
+        ttk.Label(adj_frame, text=T.size_scale_factor).grid(
             row=row, column=0, sticky="w", pady=1
         )
         self.slider_scale = ttk.Scale(
@@ -910,7 +1236,7 @@ class App(ttk.Window):
         row += 1
         
         # Rotation controls
-        ttk.Label(adj_frame, text=self.lang.get("rotation_label", "Rotation:")).grid(
+        ttk.Label(adj_frame, text=T.rotation_label).grid(
             row=row, column=0, sticky="w", pady=2
         )
         rotation_frame = ttk.Frame(adj_frame, style=self.card_frame_style)
@@ -967,33 +1293,25 @@ class App(ttk.Window):
         self.desc_text.configure(yscrollcommand=desc_scroll.set)
         self.desc_text.grid(row=0, column=0, sticky="nsew", pady=(0, 5))
         desc_scroll.grid(row=0, column=1, sticky="ns", pady=(0, 5))
-        self.desc_text.bind("<KeyRelease>", lambda e: self._save_current_form_to_backend())
-        self.desc_text.bind("<Enter>", lambda e: self._bind_mousewheel(self.desc_text))
-        self.desc_text.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        self.desc_text.bind("<KeyRelease>", self._on_form_key)
+        self._register_mousewheel(self.desc_text)
         
         # Copy button
         copy_btn = ttk.Button(
             parent, 
-            text=self.lang.get("copy_desc_button", "Copy Description"), 
+            text=self.T.copy_desc_button, 
             command=self.ui_copy_description,
             **self._button_options("secondary"),
         )
         copy_btn.grid(row=1, column=0, columnspan=2, pady=(5, 0))
 
     # ====================== HELPER METHODS ======================
-    def _update_canvas_scrollregion(self, canvas):
-        """Update the scrollregion of a canvas to match its contents."""
-        canvas.update_idletasks()
-        canvas.configure(scrollregion=canvas.bbox("all"))
-
-    def _update_canvas_itemwidth(self, canvas, item_id, width):
-        """Update the width of a canvas item."""
-        canvas.itemconfig(item_id, width=width)
-
     def _add_placeholder(self, entry, placeholder):
         """Add placeholder text to an entry widget."""
         entry.insert(0, placeholder)
-        entry.config(foreground="grey")
+        entry.configure(style=self.placeholder_entry_style)
+        # Lowercased once so search filters can recognise the placeholder cheaply
+        entry.placeholder_lc = placeholder.strip().lower()
         entry.bind("<FocusIn>", lambda args: self._on_entry_focus_in(entry, placeholder), add='+')
         entry.bind("<FocusOut>", lambda args: self._on_entry_focus_out(entry, placeholder), add='+')
 
@@ -1002,41 +1320,39 @@ class App(ttk.Window):
         current_text = entry.get()
         if current_text == placeholder:
             entry.delete(0, tk.END)
-            entry.config(foreground=self._style.lookup('TEntry', 'foreground'))
+            entry.configure(style="TEntry")
 
     def _on_entry_focus_out(self, entry, placeholder):
         """Handle entry focus out - restore placeholder if empty."""
         if not entry.get():
             entry.insert(0, placeholder)
-            entry.config(foreground="grey")
+            entry.configure(style=self.placeholder_entry_style)
 
     def _set_window_icon(self, window):
         """Set the application icon for a window."""
+        if not self._icon_path:
+            return
         try:
-            if sys.platform.startswith('win'):
-                # Determine base path - go up one level from mla directory
-                base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                icon_path = os.path.join(base_path, "icon.ico")
-                if os.path.exists(icon_path):
-                    window.iconbitmap(icon_path)
+            window.iconbitmap(self._icon_path)
         except Exception:
-            pass  # Silently ignore icon loading errors
-
-    def _get_color_from_name(self, color_name):
-        """Get a hex color value from a color name."""
-        color_name = color_name.lower()
-        color_map = {
-            "red": "#ff0000", "green": "#00ff00", "blue": "#0000ff",
-            "yellow": "#ffff00", "orange": "#ffa500", "purple": "#800080",
-            "pink": "#ffc0cb", "brown": "#a52a2a", "black": "#000000",
-            "white": "#ffffff", "grey": "#808080", "gray": "#808080",
-            "turquoise": "#40e0d0"
-        }
-        
-        for key, value in color_map.items():
-            if key in color_name:
-                return value
-        return "#cccccc"
+            self._icon_path = None  # Missing or unreadable icon - don't retry for later windows
+
+    def _get_search_index(self, items):
+        """Return (sorted_items, match_index) for a list, memoized by its contents."""
+        # The cached hashtag partitions are passed as the same list until the mapping changes
+        last = self._search_index_last
+        if last is not None and last[0] is items:
+            return last[1]
+        key = tuple(items)
+        index = self._search_cache.get(key)
+        if index is None:
+            sorted_items = sorted(key)
+            index = (sorted_items, _MatchIndex([item.lower() for item in sorted_items]))
+            if len(self._search_cache) >= 16:
+                self._search_cache.clear()
+            self._search_cache[key] = index
+        self._search_index_last = (items, index)
+        return index
 
     def _refresh_listbox_with_search(self, listbox, search_var, items, new_button_text, preserve_selection=True):
         """
@@ -1061,37 +1377,53 @@ class App(ttk.Window):
             sel = listbox.curselection()
             if sel:
                 current_selection = listbox.get(sel[0])
-                
-        listbox.delete(0, tk.END)
+        
         
         # Get search term, ignore if it's the placeholder
         search_term = search_var.get().strip().lower()
-        placeholder = self.lang.get("search_placeholder", "Search...").lower()
-        if search_term == placeholder or not search_term:
+        if search_term == self._search_placeholder_lc or not search_term:
             search_term = ""
             
-        added_items = []
-        for item in sorted(items):
-            if search_term == "" or search_term in item.lower():
-                listbox.insert(tk.END, item)
-                added_items.append(item)
-                
-        listbox.insert(tk.END, new_button_text)
+        sorted_items, match_index = self._get_search_index(items)
+        if search_term:
+            added_items = [sorted_items[i] for i in match_index.find(search_term)]
+        else:
+            added_items = list(sorted_items)
         added_items.append(new_button_text)
+
+        self._sync_listbox_items(listbox, added_items)
         
         # Restore selection or select first item
         selection_index = 0
         if current_selection and current_selection in added_items:
             selection_index = added_items.index(current_selection)
             
-        if listbox.size() > 0:
+        # Surviving rows keep their selection, so clear it before selecting
+        listbox.selection_clear(0, tk.END)
+        if added_items:
             listbox.selection_set(selection_index)
             listbox.see(selection_index)
             listbox.activate(selection_index)
             
-        listbox.update_idletasks()
         return added_items
 
+    @staticmethod
+    def _sync_listbox_items(listbox, items):
+        """Make a listbox show items, replacing only the span between the unchanged head and tail."""
+        current_items = listbox.get(0, tk.END)
+        old_len, new_len = len(current_items), len(items)
+        limit = min(old_len, new_len)
+        head = 0
+        while head < limit and current_items[head] == items[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and current_items[old_len - 1 - tail] == items[new_len - 1 - tail]:
+            tail += 1
+        if head < old_len - tail:
+            listbox.delete(head, old_len - tail - 1)
+        if head < new_len - tail:
+            listbox.insert(head, *items[head:new_len - tail])
+
     # ====================== CHECKBOX FILTER HELPER ======================
     def _filter_checkbutton_display(self, checkbuttons, search_var, container, canvas,
                                      event=None, search_entry=None, key_fn=None,
@@ -1110,71 +1442,129 @@ class App(ttk.Window):
             columns: number of grid columns (default 1)
         """
         search_term = search_var.get().lower().strip()
-        placeholder = self.lang.get("search_placeholder", "Search...").lower()
 
         is_placeholder = (
             search_entry is not None
-            and search_term == placeholder
-            and search_entry.cget("foreground") == "grey"
+            and search_term == getattr(search_entry, "placeholder_lc", self._search_placeholder_lc)
+            and str(search_entry.cget("style")) == self.placeholder_entry_style
         )
         show_all = not search_term or is_placeholder or event is None
 
-        row, col = 0, 0
-        visible = 0
-        for key, cb in checkbuttons.items():
-            match_text = key_fn(key) if key_fn else key.lower()
-            target = widget_fn(cb) if widget_fn else cb
-            if show_all or search_term in match_text:
-                target.grid(row=row, column=col, sticky="w", padx=2 if columns > 1 else 0, pady=1)
+        # Focus changes and repeated keystrokes leave the effective filter unchanged
+        filter_key = None if show_all else search_term
+        if (
+            container in self._visible_checkbuttons
+            and self._last_filter_key.get(container, ()) == filter_key
+        ):
+            return
+        self._last_filter_key[container] = filter_key
+
+        if show_all:
+            matches = set(checkbuttons)
+        elif key_fn is None:
+            # Plain lowercased names share the listbox search index, which
+            # outlives the editor window and is keyed by the names themselves
+            sorted_keys, match_index = self._get_search_index(tuple(checkbuttons))
+            matches = {sorted_keys[i] for i in match_index.find(search_term)}
+        else:
+            keys = tuple(checkbuttons)
+            cached = self._checkbutton_match_index.get(container)
+            if cached is None or cached[0] != keys:
+                cached = (keys, _MatchIndex([key_fn(key) for key in keys]))
+                self._checkbutton_match_index[container] = cached
+            matches = {keys[i] for i in cached[1].find(search_term)}
+
+        # Freshly created checkbuttons are all gridded; otherwise only touch
+        # the widgets whose visibility actually changes.
+        previous = self._visible_checkbuttons.get(container)
+        if previous is None:
+            previous = set(checkbuttons)
+        self._visible_checkbuttons[container] = matches
+        if matches == previous:
+            return
+
+        if columns == 1:
+            # Single column: each widget keeps the row it was created in, so
+            # hidden rows simply collapse and grid() restores the rest.
+            for key in previous - matches:
+                cb = checkbuttons[key]
+                (widget_fn(cb) if widget_fn else cb).grid_remove()
+            for key in matches - previous:
+                cb = checkbuttons[key]
+                (widget_fn(cb) if widget_fn else cb).grid()
+        else:
+            # Reflow in creation order, but only issue grid calls for widgets
+            # that appear, disappear or move to a different cell
+            cells = self._checkbutton_cells.get(container)
+            if cells is None:
+                cells = {key: divmod(i, columns) for i, key in enumerate(checkbuttons)}
+                self._checkbutton_cells[container] = cells
+            for key in previous - matches:
+                cb = checkbuttons[key]
+                (widget_fn(cb) if widget_fn else cb).grid_remove()
+                cells.pop(key, None)
+            row, col = 0, 0
+            visible = 0
+            for key, cb in checkbuttons.items():
+                if key not in matches:
+                    continue
+                if cells.get(key) != (row, col):
+                    target = widget_fn(cb) if widget_fn else cb
+                    target.grid(row=row, column=col, sticky="w", padx=2, pady=1)
+                    cells[key] = (row, col)
                 col = (col + 1) % columns
                 if col == 0:
                     row += 1
                 visible += 1
-            else:
-                target.grid_forget()
 
-        if columns > 1:
             num_cols_needed = 1 if visible <= row + 1 else columns
             for i in range(columns):
                 container.grid_columnconfigure(i, weight=(1 if i < num_cols_needed else 0))
 
-        container.update_idletasks()
-        self._update_canvas_scrollregion(canvas)
-        canvas.yview_moveto(0)
+        self._mark_canvas_dirty(canvas, scroll_to_top=True)
 
     # ====================== TAG & COLOR METHODS ======================
+    def _hashtag_partition(self):
+        """Return (sorted_tags, sorted_colors) from the hashtag mapping, cached per mapping version."""
+        backend = self.backend
+        if self._hashtag_partition_version != backend.hashtag_version:
+            tags, colors = [], []
+            for key in backend.hashtag_mapping:
+                # Color entries are stored as "<name> color"
+                (colors if key.endswith(" color") else tags).append(key)
+            tags.sort()
+            colors.sort()
+            self._hashtag_partition_cache = (tags, colors)
+            self._hashtag_partition_version = backend.hashtag_version
+        return self._hashtag_partition_cache
+
     def _create_tag_checkboxes(self):
-        """Create checkboxes for each known tag."""
-        for widget in self.tags_check_container.winfo_children():
-            widget.destroy()
-            
-        self.tag_vars.clear()
-        self.tag_checkbuttons.clear()
+        """Create checkboxes for each known tag, reusing those that still exist."""
+        self._visible_checkbuttons.pop(self.tags_check_container, None)
         
-        # Filter out color tags (those ending with " color")
-        sorted_tags = sorted([tag for tag in self.backend.hashtag_mapping.keys() 
-                            if not tag.endswith(" color")])
+        sorted_tags, _ = self._hashtag_partition()
+        selected = self._selected_tag_set
+        selected.intersection_update(sorted_tags)
+
+        # Only the tags added to or removed from the mapping need widget work
+        for tag in set(self.tag_checkbuttons).difference(sorted_tags):
+            self.tag_checkbuttons.pop(tag).destroy()
         
         self.tags_check_container.grid_columnconfigure(0, weight=1)
-        row_num = 0
         
-        for tag in sorted_tags:
-            var = tk.BooleanVar(value=False)
-            self.tag_vars[tag] = var
-            
-            c = ttk.Checkbutton(
-                self.tags_check_container, 
-                text=tag, 
-                variable=var, 
-                command=self._on_tag_checkbox_changed
-            )
+        for row_num, tag in enumerate(sorted_tags):
+            c = self.tag_checkbuttons.get(tag)
+            if c is None:
+                c = ttk.Checkbutton(
+                    self.tags_check_container, 
+                    text=tag, 
+                    command=lambda t=tag: self._on_tag_checkbox_changed(t)
+                )
+                self._set_check_state(c, tag in selected)
+                self.tag_checkbuttons[tag] = c
             c.grid(row=row_num, column=0, sticky="w", pady=1)
-            self.tag_checkbuttons[tag] = c
-            row_num += 1
             
-        self.tags_check_container.update_idletasks()
-        self._update_canvas_scrollregion(self.tags_canvas)
-        self.tags_canvas.yview_moveto(0)
+        self._mark_canvas_dirty(self.tags_canvas, scroll_to_top=True)
         
         # Show all tags by default
         self._filter_tags_display()
@@ -1189,28 +1579,45 @@ class App(ttk.Window):
             event=event, search_entry=self.tag_search_entry,
         )
 
-    def _on_tag_checkbox_changed(self):
+    @staticmethod
+    def _set_check_state(checkbutton, selected):
+        """Set a variable-less checkbutton's checked state."""
+        # Without a variable ttk starts in the "alternate" (tri-state) look
+        checkbutton.state(["!alternate", "selected" if selected else "!selected"])
+
+    def _sync_check_states(self, checkbuttons, old_selected, new_selected):
+        """Update only the checkbuttons whose checked state differs between two selections."""
+        for key in old_selected.symmetric_difference(new_selected):
+            cb = checkbuttons.get(key)
+            if cb is not None:
+                self._set_check_state(cb, key in new_selected)
+
+    def _on_tag_checkbox_changed(self, tag):
         """Handle tag checkbox state change."""
+        # Each click flips the checkbutton exactly once, mirrored here without a Tcl variable
+        self._selected_tag_set ^= {tag}
         self._save_current_form_to_backend()
 
     def _create_color_checkboxes(self):
-        """Create checkboxes for each color with a color swatch."""
-        for widget in self.colors_check_container.winfo_children():
-            widget.destroy()
-            
-        self.color_vars.clear()
-        self.color_checkbuttons.clear()
+        """Create checkboxes for each color with a color swatch, reusing those that still exist."""
+        self._visible_checkbuttons.pop(self.colors_check_container, None)
         
-        color_tags = [tag for tag in self.backend.hashtag_mapping.keys() if tag.endswith(" color")]
-        sorted_colors = sorted(color_tags)
+        _, sorted_colors = self._hashtag_partition()
+        selected = self._selected_color_set
+        selected.intersection_update(sorted_colors)
+
+        # Each color row lives in its own frame, so removing a color drops the frame
+        for color in set(self.color_checkbuttons).difference(sorted_colors):
+            self.color_checkbuttons.pop(color).master.destroy()
         
         self.colors_check_container.grid_columnconfigure(0, weight=1)
         
-        row_num = 0
-        for color in sorted_colors:
-            var = tk.BooleanVar(value=False)
-            self.color_vars[color] = var
-            
+        for row_num, color in enumerate(sorted_colors):
+            existing = self.color_checkbuttons.get(color)
+            if existing is not None:
+                existing.master.grid(row=row_num, column=0, sticky="ew", pady=1)
+                continue
+
             display_name = color.replace(" color", "")
             
             color_frame = ttk.Frame(self.colors_check_container, style=self.card_frame_style)
@@ -1220,19 +1627,19 @@ class App(ttk.Window):
             c = ttk.Checkbutton(
                 color_frame, 
                 text=display_name, 
-                variable=var, 
-                command=self._on_color_checkbox_changed
+                command=lambda col=color: self._on_color_checkbox_changed(col)
             )
+            self._set_check_state(c, color in selected)
             c.grid(row=0, column=0, sticky="w")
             self.color_checkbuttons[color] = c
             
-            preview_color = self._get_color_from_name(display_name)
+            preview_color = _color_from_name(display_name)
+            # Kept on the row so other views can reuse the resolved swatch color
+            color_frame.swatch_hex = preview_color
             color_swatch = tk.Canvas(color_frame, width=20, height=20, bd=0, highlightthickness=1, highlightbackground="#444")
             color_swatch.configure(bg=preview_color)
             color_swatch.grid(row=0, column=1, padx=(6, 2), pady=1, sticky="e")
             
-            row_num += 1
-            
         # Initially show all colors
         self._filter_colors_display()
 
@@ -1248,14 +1655,19 @@ class App(ttk.Window):
             widget_fn=lambda cb: cb.master,
         )
 
-    def _on_color_checkbox_changed(self):
+    def _on_color_checkbox_changed(self, color):
         """Handle color checkbox state change."""
+        self._selected_color_set ^= {color}
         self._save_current_form_to_backend()
 
     # ====================== FORM HANDLING ======================
     def _update_clothing_type_options(self):
         """Update the clothing type dropdown options."""
-        options = [""] + sorted(list(self.backend.templates.keys()))
+        options = [""] + sorted(self.backend.templates)
+        # Navigating between projects leaves the templates untouched
+        if options == self._clothing_type_options:
+            return
+        self._clothing_type_options = options
         current_val = self.clothing_type_var.get()
         self.clothing_type_combo['values'] = options
         
@@ -1267,8 +1679,11 @@ class App(ttk.Window):
 
     def _on_clothing_type_changed(self, event=None):
         """Handle clothing type selection change."""
+        backend = self.backend
+        if self._suppress_events:
+            return
         new_type = self.clothing_type_var.get()
-        proj = self.backend.get_current_project()
+        proj = backend.get_current_project()
         
         if not proj or proj.clothing_type == new_type:
             return
@@ -1276,35 +1691,48 @@ class App(ttk.Window):
         self._save_current_form_to_backend()
         self._update_measurement_fields_display(new_type)
         
-        default_tags = self.backend.templates.get(new_type, {}).get("default_tags", [])
+        default_tags = backend.templates.get(new_type, {}).get("default_tags", [])
         changed_tags = False
         
         for dt in default_tags:
-            if dt in self.tag_vars and not self.tag_vars[dt].get():
-                self.tag_vars[dt].set(True)
+            if dt in self.tag_checkbuttons and dt not in self._selected_tag_set:
+                self._set_check_state(self.tag_checkbuttons[dt], True)
+                self._selected_tag_set.add(dt)
                 changed_tags = True
                 
         if changed_tags:
             self._save_current_form_to_backend(update_type=new_type)
         else:
-            self.backend.update_project_data(self.backend.get_current_project_index(), {'clothing_type': new_type})
+            backend.update_project_data(backend.get_current_project_index(), clothing_type=new_type)
             
         self.refresh_left_controls_display()
 
     def _update_measurement_fields_display(self, clothing_type):
         """Update the measurement fields based on clothing type."""
+        backend = self.backend
+        fields = tuple(backend.templates.get(clothing_type, {}).get("fields", [])) if clothing_type else ()
+        proj = backend.get_current_project()
+
+        # Same field layout as shown (e.g. next project has the same type): only swap the values
+        if fields == self._measurement_fields:
+            for field, entry in self.measurement_entries.items():
+                value = proj.measurements.get(field, "") if proj else ""
+                if entry.get() != value:
+                    entry.delete(0, tk.END)
+                    entry.insert(tk.END, value)
+            return
+
         for widget in self.measurement_lframe.winfo_children():
             if isinstance(widget, (ttk.Entry, ttk.Label)):
                 widget.destroy()
                 
         self.measurement_entries = {}
+        self._measurement_fields = fields
         
         # If no clothing type, just return (frame will be hidden)
-        if not clothing_type:
+        if not fields:
             return
             
-        fields = self.backend.templates.get(clothing_type, {}).get("fields", [])
-        proj = self.backend.get_current_project()
         row_num = 0
         
         for field in fields:
@@ -1317,7 +1745,7 @@ class App(ttk.Window):
             if proj:
                 entry.insert(tk.END, proj.measurements.get(field, ""))
                 
-            entry.bind("<KeyRelease>", lambda e, f=field: self._save_current_form_to_backend())
+            entry.bind("<KeyRelease>", self._on_form_key)
             entry.bind("<Return>", self._focus_next_widget)
             self.measurement_entries[field] = entry
             row_num += 1
@@ -1327,14 +1755,24 @@ class App(ttk.Window):
         event.widget.tk_focusNext().focus()
         return "break"  # Prevent default behavior
 
+    def _on_form_key(self, event=None):
+        """Schedule a form save once typing in one of its fields pauses."""
+        if self._suppress_events:
+            return
+        self._debounce("form_save", 200, self._save_current_form_to_backend)
+
     def _save_current_form_to_backend(self, update_type=None):
         """Save the current form data to the backend."""
-        idx = self.backend.get_current_project_index()
+        # An explicit save supersedes any keystroke save still waiting to run
+        self._cancel_debounce("form_save")
+        backend = self.backend
+        idx = backend.get_current_project_index()
         if idx is None or idx < 0:
             return
             
-        selected_tags = [tag for tag, var in self.tag_vars.items() if var.get()]
-        selected_colors = [color for color, var in self.color_vars.items() if var.get()]
+        # Maintained by the checkbox handlers, so no Tcl variable reads are needed here
+        selected_tags = sorted(self._selected_tag_set)
+        selected_colors = sorted(self._selected_color_set)
         
         proj_data = {
             "clothing_type": update_type if update_type is not None else self.clothing_type_var.get(),
@@ -1347,18 +1785,38 @@ class App(ttk.Window):
             "owner_letter": self.owner_entry.get(),
             "storage_letter": self.storage_entry.get()
         }
-            
-        self.backend.update_project_data(idx, **proj_data)
+
+        # Skip the write when nothing changed since the last save of this project
+        signature = (id(backend.get_project(idx)),) + tuple(
+            tuple(value.items()) if isinstance(value, dict)
+            else tuple(value) if isinstance(value, list)
+            else value
+            for value in proj_data.values()
+        )
+        if signature == self._last_form_signature:
+            return
+        self._last_form_signature = signature
+
+        backend.update_project_data(idx, **proj_data)
 
     # ====================== UI DISPLAY UPDATES ======================
     def refresh_all_displays(self):
         """Refresh all UI elements with current data."""
-        self.refresh_left_controls_display()
-        self.refresh_right_display()
-        self._update_project_label()
+        # Suppress form callbacks while widgets are repopulated, then flush once
+        was_suppressed = self._suppress_events
+        self._suppress_events = True
+        try:
+            self.refresh_left_controls_display()
+            self.refresh_right_display()
+            self._update_project_label()
+        finally:
+            self._suppress_events = was_suppressed
+        self.update_idletasks()
 
     def refresh_left_controls_display(self):
         """Refresh the left panel controls with current project data."""
+        # The form is repopulated from the backend, so the next save must not be skipped
+        self._last_form_signature = None
         proj = self.backend.get_current_project()
         has_proj = proj is not None
         has_clothing_type = has_proj and proj.clothing_type
@@ -1383,24 +1841,29 @@ class App(ttk.Window):
             self.measurement_lframe.grid_remove()  # Hide the frame
             
         selected_tag_set = set(proj.selected_tags) if has_proj else set()
+        new_tag_set = selected_tag_set.intersection(self.tag_checkbuttons)
 
-        if not hasattr(self, 'tag_vars') or not self.tag_vars:
+        if not self.tag_checkbuttons:
+            self._selected_tag_set = set(selected_tag_set)
             self._create_tag_checkboxes()
         else:
-            for tag, var in self.tag_vars.items():
-                var.set(tag in selected_tag_set)
+            self._sync_check_states(self.tag_checkbuttons, self._selected_tag_set, new_tag_set)
+            self._selected_tag_set = new_tag_set
             self._filter_tags_display()
         
         # Ensure color checkboxes are created
-        if not hasattr(self, 'color_vars') or not self.color_vars:
+        selected_color_set = set(proj.selected_colors) if has_proj else set()
+        if has_proj and not selected_color_set and selected_tag_set:
+            # Backwards compatibility for sessions created before color separation
+            selected_color_set = {color for color in selected_tag_set if color.endswith(" color")}
+
+        if not self.color_checkbuttons:
+            self._selected_color_set = selected_color_set
             self._create_color_checkboxes()
         else:
-            selected_color_set = set(proj.selected_colors) if has_proj else set()
-            if has_proj and not selected_color_set and selected_tag_set:
-                # Backwards compatibility for sessions created before color separation
-                selected_color_set = {color for color in selected_tag_set if color in self.color_vars}
-            for color, var in self.color_vars.items():
-                var.set(color in selected_color_set)
+            selected_color_set.intersection_update(self.color_checkbuttons)
+            self._sync_check_states(self.color_checkbuttons, self._selected_color_set, selected_color_set)
+            self._selected_color_set = selected_color_set
             self._filter_colors_display()
             
         custom_val = proj.custom_hashtags if has_proj else ""
@@ -1420,15 +1883,26 @@ class App(ttk.Window):
 
     def refresh_right_display(self):
         """Refresh the right panel display with optimized widget recycling and thumbnail caching."""
-        proj = self.backend.get_current_project()
+        lang = self.lang
+        backend = self.backend
+        proj = backend.get_current_project()
+
+        # Thumbnails belong to the project they were rendered for
+        if proj is not self._thumb_cache_owner:
+            self._thumb_cache.clear()
+            self._thumb_cache_owner = proj
         
         # Store existing widgets for recycling
-        existing_widgets = self.proc_image_widgets.copy() if hasattr(self, 'proc_image_widgets') else []
+        existing_widgets = self.proc_image_widgets + self._unprocessed_item_widgets
         self.proc_image_widgets = []
+        self.proc_widget_by_index = {}
+        self._unprocessed_item_widgets = []
         
-        # Hide all widgets initially instead of destroying them
+        # Hide stray widgets (placeholder, error labels); recycled cells are re-gridded in place
+        pooled_frames = {w.get('frame') for w in existing_widgets}
         for child in self.img_display_frame.winfo_children():
-            child.grid_forget()
+            if child not in pooled_frames:
+                child.grid_forget()
         
         display_placeholder = True
         previous_selection = self.selected_processed_index
@@ -1475,7 +1949,7 @@ class App(ttk.Window):
                     
                     ttk.Button(
                         img_control_frame, 
-                        text=self.lang.get("remove_image_button", "Remove Image"), 
+                        text=lang.get("remove_image_button", "Remove Image"), 
                         width=10,
                         command=lambda idx=i: self.ui_remove_image(idx),
                         **self._button_options("danger"),
@@ -1483,19 +1957,21 @@ class App(ttk.Window):
                 
                 # Display original image thumbnail using cache
                 orig_lbl = widget_entry.get('orig_label') if widget_entry else None
+                orig_source = img_data["image"]
                 try:
-                    # Use backend's cached thumbnail method
-                    orig_thumb = self.backend.get_cached_thumbnail(img_data["image"], (150, 150))
-                    orig_photo = ImageTk.PhotoImage(orig_thumb)
-
-                    if orig_lbl:
+                    if orig_lbl and widget_entry.get('orig_source') is orig_source:
+                        pass  # Same source image as last time - keep the existing PhotoImage
+                    elif orig_lbl:
+                        orig_photo = self._get_thumb_photo(orig_source, (150, 150))
                         orig_lbl.configure(image=orig_photo)
                         orig_lbl.image = orig_photo
                     else:
+                        orig_photo = self._get_thumb_photo(orig_source, (150, 150))
                         orig_lbl = ttk.Label(item_frame, image=orig_photo, cursor="hand2")
                         orig_lbl.image = orig_photo
                         orig_lbl.grid(row=0, column=0, pady=(0, 5))
-                        orig_lbl.bind("<Double-Button-1>", lambda e, img=img_data["image"]: self._show_image_popup(img))
+                        # Resolve the image at click time so recycled labels never pin stale images
+                        orig_lbl.bind("<Double-Button-1>", lambda e, idx=i: self._show_project_image_popup(idx))
                 except Exception:
                     if not (widget_entry and widget_entry.get('orig_label')):
                         ttk.Label(item_frame, text="Error loading image").grid(row=0, column=0, pady=(0, 5))
@@ -1507,14 +1983,23 @@ class App(ttk.Window):
                     prev_btn = widget_entry.get('prev_button') if widget_entry else None
                     next_btn = widget_entry.get('next_button') if widget_entry else None
                     proc_lbl = widget_entry.get('label') if widget_entry else None
+                    status_lbl = widget_entry.get('status_label') if widget_entry else None
+                    if status_lbl is not None:
+                        status_lbl.grid_remove()
 
                     try:
                         processed_img = proc_item["processed"]
-                        thumb_w, thumb_h = (200, 150) if proc_item.get("is_horizontal", False) else (150, 200)
-
-                        # Use cached thumbnail for processed image
-                        proc_thumb = self.backend.get_cached_thumbnail(processed_img, (thumb_w, thumb_h))
-                        proc_photo = ImageTk.PhotoImage(proc_thumb)
+                        thumb_size = (200, 150) if proc_item.get("is_horizontal", False) else (150, 200)
+
+                        # Rebuild the preview only if the processed image or its size changed
+                        if (
+                            proc_lbl is not None
+                            and widget_entry.get('proc_source') is processed_img
+                            and widget_entry.get('proc_size') == thumb_size
+                        ):
+                            proc_photo = widget_entry['photo']
+                        else:
+                            proc_photo = self._get_thumb_photo(processed_img, thumb_size)
 
                         if nav_frame is None:
                             nav_frame = ttk.Frame(item_frame, style=self.panel_style)
@@ -1553,13 +2038,15 @@ class App(ttk.Window):
                             )
                             proc_lbl.grid(row=0, column=1)
                             proc_lbl.bind("<Button-1>", lambda e, idx=i: self._on_processed_image_click(idx))
-                            proc_lbl.bind("<Double-Button-1>", lambda e, img=processed_img: self._show_image_popup(img))
-                        else:
+                            proc_lbl.bind("<Double-Button-1>", lambda e, idx=i: self._show_project_image_popup(idx, processed=True))
+                        elif proc_lbl.image is not proc_photo:
                             proc_lbl.configure(image=proc_photo)
                         proc_lbl.image = proc_photo
 
                         widget_info = {
                             "label": proc_lbl,
+                            # Border width currently applied to the label, carried across refreshes
+                            "border": widget_entry.get("border", 1) if widget_entry else 1,
                             "photo": proc_photo,
                             "index": i,
                             "frame": item_frame,
@@ -1567,8 +2054,13 @@ class App(ttk.Window):
                             "nav_frame": nav_frame,
                             "prev_button": prev_btn,
                             "next_button": next_btn,
+                            "status_label": status_lbl,
+                            "orig_source": orig_source,
+                            "proc_source": processed_img,
+                            "proc_size": thumb_size,
                         }
                         self.proc_image_widgets.append(widget_info)
+                        self.proc_widget_by_index[i] = widget_info
                         self._set_background_indicator_for_widget(widget_info, proc_item)
                     except Exception:
                         if not (widget_entry and widget_entry.get('label')):
@@ -1576,11 +2068,28 @@ class App(ttk.Window):
                 else:
                     if widget_entry and widget_entry.get('nav_frame'):
                         widget_entry['nav_frame'].grid_forget()
-                    if not widget_entry:
-                        ttk.Label(
+                    status_lbl = widget_entry.get('status_label') if widget_entry else None
+                    if status_lbl is None:
+                        status_lbl = ttk.Label(
                             item_frame,
-                            text=self.lang.get("not_processed", "(Not Processed)")
-                        ).grid(row=1, column=0)
+                            text=lang.get("not_processed", "(Not Processed)")
+                        )
+                    status_lbl.grid(row=1, column=0)
+
+                    # Track unprocessed cells too so their frames are recycled or destroyed
+                    unprocessed_info = dict(widget_entry) if widget_entry else {}
+                    unprocessed_info.update({
+                        "index": i,
+                        "frame": item_frame,
+                        "orig_label": orig_lbl,
+                        "status_label": status_lbl,
+                        "orig_source": orig_source,
+                        "proc_source": None,
+                    })
+                    if unprocessed_info.get("label") is not None:
+                        unprocessed_info["label"].image = None
+                    unprocessed_info["photo"] = None
+                    self._unprocessed_item_widgets.append(unprocessed_info)
                 
                 # Move to next column or row
                 col_num = (col_num + 1) % max_cols
@@ -1588,7 +2097,7 @@ class App(ttk.Window):
                     row_num += 1
         
         # Clean up unused widgets
-        used_indices = {w['index'] for w in self.proc_image_widgets if 'index' in w}
+        used_indices = {w['index'] for w in self.proc_image_widgets + self._unprocessed_item_widgets if 'index' in w}
         for widget_data in existing_widgets:
             if 'index' in widget_data and widget_data['index'] not in used_indices:
                 if 'frame' in widget_data and widget_data['frame']:
@@ -1600,9 +2109,9 @@ class App(ttk.Window):
             for child in self.img_display_frame.winfo_children():
                 child.destroy()
             
-            msg = (self.lang.get("no_project", "No project loaded or selected.") if not proj else
-                   self.lang.get("no_images_in_project", "No clothing images loaded for this project."))
-            hint = self.lang.get(
+            msg = (lang.get("no_project", "No project loaded or selected.") if not proj else
+                   lang.get("no_images_in_project", "No clothing images loaded for this project."))
+            hint = lang.get(
                 "empty_hint",
                 "Use \"Images\" or \"Zip\" in the toolbar to get started.",
             )
@@ -1618,20 +2127,13 @@ class App(ttk.Window):
         elif self.selected_processed_index is not None and self.selected_processed_index >= len(proj.processed_images):
             self.selected_processed_index = None
         
-        # Force layout update only if needed
-        if self.proc_image_widgets and len(self.proc_image_widgets) != len(existing_widgets):
-            self.update_idletasks()
-        
-        # Highlight the selected image if any
-        need_highlight = (self.selected_processed_index is not None and self.proc_image_widgets)
-        if need_highlight:
-            self._highlight_selected_processed()
+        # Sync borders; recycled labels may still show a previous selection
+        self._highlight_selected_processed()
         
         self._populate_adjustment_fields()
         
-        # Update canvas scrollregion only if layout changed
-        self.img_display_frame.update_idletasks()
-        self._update_canvas_scrollregion(self.img_canvas)
+        # Scrollregion follows on the next idle pass, together with any resize events
+        self._mark_canvas_dirty(self.img_canvas, scrollbar=self.img_scrollbar)
         
         # Update description text only if it changed
         current_desc_text = self.desc_text.get(1.0, tk.END).strip()
@@ -1653,30 +2155,39 @@ class App(ttk.Window):
 
     def _highlight_selected_processed(self):
         """Highlight the selected image with a thicker border."""
-        if not self.proc_image_widgets or self.selected_processed_index is None:
+        if not self.proc_image_widgets:
             return
             
-        selected_border = 4      # Thicker border for selected images
-        normal_border = 1        # Thin border for unselected images
-        
+        # Only labels whose border differs from the wanted one are reconfigured
         for widget_info in self.proc_image_widgets:
-            lbl = widget_info["label"]
-            idx = widget_info["index"]
-            
-            if idx == self.selected_processed_index:
-                lbl.configure(relief="solid", borderwidth=selected_border)
-            else:
-                lbl.configure(relief="solid", borderwidth=normal_border)
+            self._set_cell_border(widget_info, widget_info["index"] == self.selected_processed_index)
+
+    def _set_cell_border(self, widget_info, selected):
+        """Give a processed image label the selected or normal border if it doesn't have it yet."""
+        width = 4 if selected else 1
+        if widget_info.get("border", 1) != width:
+            widget_info["label"].configure(relief="solid", borderwidth=width)
+            widget_info["border"] = width
+
+    def _base_background_choices(self):
+        """Return (choices, seen) for the library backgrounds, cached until the list changes."""
+        # The library bumps its version on every rescan, add and removal
+        sig = self.backend.backgrounds_version
+        if sig != self._bg_choices_sig:
+            choices = [None]
+            seen = {None}
+            for path in self.backend.backgrounds:
+                if path not in seen:
+                    choices.append(path)
+                    seen.add(path)
+            self._bg_choices_cache = (tuple(choices), frozenset(seen))
+            self._bg_choices_sig = sig
+        return self._bg_choices_cache
 
     def _background_choices_for_item(self, processed_item):
         """Return available background options (None represents auto selection)."""
-        choices = [None]
-        seen = {None}
-
-        for path in self.backend.backgrounds:
-            if path not in seen:
-                choices.append(path)
-                seen.add(path)
+        base, seen = self._base_background_choices()
+        choices = list(base)
 
         user_choice = processed_item.get("user_bg_path")
         if user_choice and user_choice not in seen:
@@ -1694,8 +2205,12 @@ class App(ttk.Window):
 
         if processed_item.get("use_solid_bg", False):
             state = "disabled"
-        elif len(self._background_choices_for_item(processed_item)) <= 1:
-            state = "disabled"
+        else:
+            # Only the count matters here, so skip copying the choice list
+            base, seen = self._base_background_choices()
+            user_choice = processed_item.get("user_bg_path")
+            if len(base) + (1 if user_choice and user_choice not in seen else 0) <= 1:
+                state = "disabled"
 
         for btn in buttons:
             if btn is not None:
@@ -1707,50 +2222,90 @@ class App(ttk.Window):
         if not proj or not (0 <= image_index < len(proj.processed_images)):
             return
 
-        widget_info = next(
-            (wi for wi in self.proc_image_widgets if wi.get("index") == image_index),
-            None
-        )
+        widget_info = self.proc_widget_by_index.get(image_index)
 
         if widget_info:
             self._set_background_indicator_for_widget(widget_info, proj.processed_images[image_index])
 
+    def _refresh_background_indicators(self):
+        """Resync every processed image's background arrows after the library changed."""
+        proj = self.backend.get_current_project()
+        if not proj:
+            return
+        processed = proj.processed_images
+        for widget_info in self.proc_image_widgets:
+            index = widget_info.get("index")
+            if index is not None and 0 <= index < len(processed):
+                self._set_background_indicator_for_widget(widget_info, processed[index])
+
+    @staticmethod
+    def _render_thumbnail(pil_image, size):
+        """Return a PIL image scaled down to fit size, leaving the source untouched."""
+        # Resize straight from the source; thumbnail() would first copy it at full size
+        return pil_image.resize(
+            ImageProcessor._fit_within(pil_image.size, size), Image.Resampling.BILINEAR, reducing_gap=2.0
+        )
+
+    def _get_thumb_photo(self, pil_image, size):
+        """Return a cached PhotoImage thumbnail for a PIL image at the given size."""
+        key = (id(pil_image), size)
+        entry = self._thumb_cache.get(key)
+        # Holding the source image keeps its id from being reused by another object
+        if entry is not None and entry[0] is pil_image:
+            return entry[1]
+        if len(self._thumb_cache) > 256:
+            self._thumb_cache.clear()
+        photo = ImageTk.PhotoImage(self._render_thumbnail(pil_image, size))
+        self._thumb_cache[key] = (pil_image, photo)
+        return photo
+
+    def _recycle_thumb_photo(self, widget_info, pil_image, size):
+        """Paste a new thumbnail into the cell's PhotoImage if the dimensions still match."""
+        photo = widget_info.get("photo")
+        old_source = widget_info.get("proc_source")
+        if photo is None or old_source is None or widget_info.get("proc_size") != size:
+            return None
+        thumb = self._render_thumbnail(pil_image, size)
+        if (photo.width(), photo.height()) != thumb.size:
+            return None
+        photo.paste(thumb)
+        # Re-key the cache entry so it no longer pins the superseded image
+        self._thumb_cache.pop((id(old_source), size), None)
+        self._thumb_cache[(id(pil_image), size)] = (pil_image, photo)
+        return photo
+
     def _update_processed_thumbnail(self, image_index, new_image):
         """Refresh the cached thumbnail shown in the processed image preview."""
         proj = self.backend.get_current_project()
         if not proj or not (0 <= image_index < len(proj.processed_images)):
             return
 
-        widget_info = next(
-            (wi for wi in self.proc_image_widgets if wi.get("index") == image_index),
-            None
-        )
+        widget_info = self.proc_widget_by_index.get(image_index)
 
         if not widget_info or not widget_info.get("label"):
             return
 
         proc_item = proj.processed_images[image_index]
         thumb_w, thumb_h = (200, 150) if proc_item.get("is_horizontal", False) else (150, 200)
-        thumb = new_image.copy()
-        thumb.thumbnail((thumb_w, thumb_h))
-
-        photo = ImageTk.PhotoImage(thumb)
+        size = (thumb_w, thumb_h)
+        photo = self._recycle_thumb_photo(widget_info, new_image, size)
+        if photo is None:
+            photo = self._get_thumb_photo(new_image, size)
         widget_info["label"].configure(image=photo)
         widget_info["label"].image = photo
         widget_info["photo"] = photo
+        widget_info["proc_source"] = new_image
+        widget_info["proc_size"] = (thumb_w, thumb_h)
 
         self._set_background_indicator_for_widget(widget_info, proc_item)
 
     def _cycle_background(self, image_index, direction):
         """Cycle through available backgrounds for a processed image."""
-        proj = self.backend.get_current_project()
+        backend = self.backend
+        project_index, proj = backend.get_current_project_and_index()
         if not proj or not (0 <= image_index < len(proj.processed_images)):
             return
 
-        project_index = self.backend.get_current_project_index()
-        if project_index is None or project_index < 0:
-            return
-
         processed_item = proj.processed_images[image_index]
 
         previous_choice = processed_item.get("user_bg_path")
@@ -1775,7 +2330,7 @@ class App(ttk.Window):
         if self.selected_processed_index != image_index:
             self._on_processed_image_click(image_index)
 
-        new_image = self.backend.apply_image_adjustments(
+        new_image = backend.apply_image_adjustments(
             project_index,
             image_index,
             bg_path=new_choice,
@@ -1876,6 +2431,32 @@ class App(ttk.Window):
         # Apply the rotation
         self._process_with_indicator(self.ui_apply_adjustments)
     
+    def _clear_image_widgets(self):
+        """Destroy all image cells and release their PhotoImage references."""
+        for widget_info in self.proc_image_widgets + self._unprocessed_item_widgets:
+            for key in ("label", "orig_label"):
+                if widget_info.get(key) is not None:
+                    widget_info[key].image = None
+            widget_info["photo"] = None
+            if widget_info.get("frame") is not None:
+                widget_info["frame"].destroy()
+        self.proc_image_widgets = []
+        self.proc_widget_by_index = {}
+        self._unprocessed_item_widgets = []
+        self._thumb_cache.clear()
+        self._thumb_cache_owner = None
+
+    def _show_project_image_popup(self, image_index, processed=False):
+        """Show the current original or processed image at the given index."""
+        proj = self.backend.get_current_project()
+        if not proj:
+            return
+        if processed:
+            if 0 <= image_index < len(proj.processed_images):
+                self._show_image_popup(proj.processed_images[image_index].get("processed"))
+        elif 0 <= image_index < len(proj.clothing_images):
+            self._show_image_popup(proj.clothing_images[image_index]["image"])
+
     def _show_image_popup(self, pil_image):
         """Display an image in a popup window at its actual size."""
         if not pil_image:
@@ -1948,11 +2529,11 @@ class App(ttk.Window):
 
         self._schedule_slider_apply()
 
-    def _schedule_slider_apply(self, delay: int = 200):
-        """Debounce expensive image recomposition while the slider is moving."""
-        if self._slider_apply_job is not None:
-            self.after_cancel(self._slider_apply_job)
-        self._slider_apply_job = self.after(delay, self._apply_slider_changes)
+    def _schedule_slider_apply(self, delay: int = 33):
+        """Throttle image recomposition to at most one pass per delay while the slider moves."""
+        # Keep an already pending pass; it reads the slider values when it runs
+        if self._slider_apply_job is None:
+            self._slider_apply_job = self.after(delay, self._apply_slider_changes)
 
     def _cancel_pending_slider_apply(self):
         """Cancel any pending apply scheduled from slider movement."""
@@ -1994,14 +2575,12 @@ class App(ttk.Window):
         self.selected_processed_index = index
         
         # Directly update only the two images that changed state
-        for widget_info in self.proc_image_widgets:
-            idx = widget_info["index"]
-            if idx == index:
-                # Thicker solid border for selected
-                widget_info["label"].configure(relief="solid", borderwidth=4)
-            elif idx == prev_selection:
-                # Thin border for unselected
-                widget_info["label"].configure(relief="solid", borderwidth=1)
+        widget_info = self.proc_widget_by_index.get(prev_selection)
+        if widget_info:
+            self._set_cell_border(widget_info, False)
+        widget_info = self.proc_widget_by_index.get(index)
+        if widget_info:
+            self._set_cell_border(widget_info, True)
         
         self._populate_adjustment_fields()
 
@@ -2017,11 +2596,12 @@ class App(ttk.Window):
 
     def next_project(self):
         """Navigate to the next project."""
-        idx = self.backend.get_current_project_index()
-        count = self.backend.get_project_count()
+        backend = self.backend
+        idx = backend.get_current_project_index()
+        count = backend.get_project_count()
         if idx is not None and idx < count - 1:
             self._save_current_form_to_backend()
-            self.backend.set_current_project_index(idx + 1)
+            backend.set_current_project_index(idx + 1)
             self.selected_processed_index = None
             self.refresh_all_displays()
 
@@ -2034,7 +2614,7 @@ class App(ttk.Window):
             *args, **kwargs: Arguments to pass to the function
         """
         dialog = tk.Toplevel(self)
-        dialog.title(self.lang.get("processing_title", "Processing"))
+        dialog.title(self.T.processing_title)
         dialog.geometry("250x100")
         dialog.transient(self)
         dialog.resizable(False, False)
@@ -2051,7 +2631,7 @@ class App(ttk.Window):
         
         ttk.Label(
             dialog, 
-            text=self.lang.get("processing_warning", "Processing image..."), 
+            text=self.T.processing_warning, 
             font=("TkDefaultFont", 10, "bold")
         ).pack(pady=(15, 10))
         
@@ -2059,7 +2639,7 @@ class App(ttk.Window):
         progress.pack(pady=(0, 10))
         progress.start(10)
         
-        dialog.update()
+        dialog.update_idletasks()
         
         # Execute operation after UI update
         def execute_operation():
@@ -2076,11 +2656,12 @@ class App(ttk.Window):
 
     def ui_load_single_project_images(self):
         """Load images into a new project (no naming)."""
+        T = self.T
         paths = filedialog.askopenfilenames(
-            title=self.lang.get("select_images", "Select Images"),
+            title=T.select_images,
             filetypes=[
-                (self.lang.get("image_files", "Image Files"), "*.png *.jpg *.jpeg *.gif *.bmp *.webp"),
-                (self.lang.get("all_files", "All Files"), "*.*")
+                (T.image_files, "*.png *.jpg *.jpeg *.gif *.bmp *.webp"),
+                (T.all_files, "*.*")
             ],
             parent=self
         )
@@ -2093,8 +2674,8 @@ class App(ttk.Window):
         
         if errors:
             messagebox.showwarning(
-                self.lang.get("warning", "Warning"),
-                self.lang.get("load_errors", "Some images could not be loaded:\n") + "\n".join(errors[:5]),
+                T.warning,
+                T.load_errors + "\n".join(errors[:5]),
                 parent=self
             )
         
@@ -2103,8 +2684,9 @@ class App(ttk.Window):
 
     def ui_load_projects_zip(self):
         """Load projects from a zip file."""
+        T = self.T
         zip_path = filedialog.askopenfilename(
-            title=self.lang.get("load_zip_button", "Load Zip"),
+            title=T.load_zip_button,
             filetypes=[("Zip Files", "*.zip")],
             parent=self
         )
@@ -2113,27 +2695,55 @@ class App(ttk.Window):
             return
 
         self.config(cursor="watch")
-        self.update_idletasks()
+        popup, progress, status_var = self._create_progress_popup(
+            T.load_zip_button,
+            T.loading_zip
+        )
+
+        # The worker only records the latest progress; Tk widgets are
+        # updated from the polling callback on the main thread.
+        latest_progress = [None]
+
+        def progress_callback(current, total, message):
+            latest_progress[0] = (current, total, message)
+
+        future = self.backend.load_projects_from_zip_async(zip_path, progress_callback)
+
+        def check_future():
+            if latest_progress[0] is not None:
+                current, total, message = latest_progress[0]
+                progress["maximum"] = max(total, 1)
+                progress["value"] = current
+                status_var.set(message)
+            if future.done():
+                self.config(cursor="")
+                popup.destroy()
+                self._on_zip_loaded(future)
+            else:
+                self.after(100, check_future)
 
+        self.after(100, check_future)
+
+    def _on_zip_loaded(self, future):
+        """Report the result of a background zip load and refresh the UI."""
+        lang = self.lang
         try:
-            success, message, img_count, errors = self.backend.load_projects_from_zip(zip_path)
+            success, message, img_count, errors = future.result()
         except Exception as e:
             success = False
             message = f"An unexpected error occurred during zip loading:\n{e}"
             img_count = 0
             errors = []
-        finally:
-            self.config(cursor="")
 
         if success:
             messagebox.showinfo(
-                self.lang.get("success", "Success"),
+                lang.get("success", "Success"),
                 message,
                 parent=self
             )
             if errors:
                 messagebox.showwarning(
-                    self.lang.get("warning", "Warning"),
+                    lang.get("warning", "Warning"),
                     "Zip Load Issues:\n- " + "\n- ".join(errors),
                     parent=self
                 )
@@ -2141,37 +2751,39 @@ class App(ttk.Window):
             self.refresh_all_displays()
         else:
             messagebox.showerror(
-                self.lang.get("error", "Error"),
+                lang.get("error", "Error"),
                 message,
                 parent=self
             )
 
     def ui_add_new_project(self):
         """Add a new empty project and switch to it."""
+        backend = self.backend
         self._save_current_form_to_backend()
         # Use index-based naming
-        project_count = self.backend.get_project_count()
-        self.backend.add_new_project(f"Project_{project_count + 1}")
-        new_index = self.backend.get_current_project_index()
+        project_count = backend.get_project_count()
+        backend.add_new_project(f"Project_{project_count + 1}")
+        new_index = backend.get_current_project_index()
         if new_index is not None:
-            self.backend.set_current_project_index(new_index)
+            backend.set_current_project_index(new_index)
         self.selected_processed_index = None
         self.refresh_all_displays()
 
     def ui_remove_current_project(self):
         """Remove the current project after confirmation."""
+        T = self.T
         idx = self.backend.get_current_project_index()
         if idx is None or idx < 0:
             messagebox.showwarning(
-                self.lang.get("warning", "Warning"), 
-                self.lang.get("no_project", "No project loaded or selected."), 
+                T.warning, 
+                T.no_project, 
                 parent=self
             )
             return
             
         if messagebox.askyesno(
-            self.lang.get("confirm_delete", "Confirm Deletion"), 
-            self.lang.get("confirm_remove_project", "Remove current project?"), 
+            T.confirm_delete, 
+            T.confirm_remove_project, 
             parent=self
         ):
             result = self.backend.remove_project(idx)
@@ -2180,46 +2792,57 @@ class App(ttk.Window):
                 self.refresh_all_displays()
             else:
                 messagebox.showwarning(
-                    self.lang.get("warning", "Warning"), 
+                    T.warning, 
                     "Failed to delete project", 
                     parent=self
                 )
 
+    def _create_progress_popup(self, title, message):
+        """Create a modal progress popup and return (popup, progressbar, status_var)."""
+        popup = tk.Toplevel(self)
+        popup.title(title)
+        popup.geometry("400x120")
+        popup.transient(self)
+        popup.grab_set()
+        self._set_window_icon(popup)
+
+        # Prevent closing while the operation runs
+        popup.protocol("WM_DELETE_WINDOW", lambda: None)
+
+        ttk.Label(popup, text=message).pack(padx=20, pady=10)
+        progress = ttk.Progressbar(popup, orient="horizontal", length=350, mode="determinate")
+        progress.pack(padx=20, pady=5)
+        status_var = tk.StringVar(value="Initializing...")
+        ttk.Label(popup, textvariable=status_var).pack(padx=20, pady=5)
+        return popup, progress, status_var
+
     def ui_process_current_project_images(self):
         """Process all images in the current project with async threading."""
-        import threading
+        T = self.T
+        backend = self.backend
         
-        idx = self.backend.get_current_project_index()
-        if idx is None or idx < 0:
-            messagebox.showwarning(
-                self.lang.get("warning", "Warning"),
-                self.lang.get("no_project", "No project loaded or selected."),
-                parent=self
-            )
-            return
-
-        proj = self.backend.get_project(idx)
+        idx, proj = backend.get_current_project_and_index()
         if not proj:
             messagebox.showwarning(
-                self.lang.get("warning", "Warning"), 
-                self.lang.get("no_project", "No project loaded or selected."), 
+                T.warning,
+                T.no_project,
                 parent=self
             )
             return
             
         if not proj.clothing_images:
             messagebox.showwarning(
-                self.lang.get("warning", "Warning"), 
-                self.lang.get("no_image_loaded", "Please upload clothing images first."), 
+                T.warning, 
+                T.no_image_loaded, 
                 parent=self
             )
             return
             
         # Check if we can process: need either backgrounds OR solid color mode enabled
-        if not self.backend.backgrounds and not self.backend.use_solid_bg:
+        if not backend.backgrounds and not backend.use_solid_bg:
             messagebox.showwarning(
-                self.lang.get("warning", "Warning"), 
-                self.lang.get("no_background", "No background images found. Please add backgrounds or enable solid color mode."), 
+                T.warning, 
+                T.no_background, 
                 parent=self
             )
             return
@@ -2228,7 +2851,7 @@ class App(ttk.Window):
         
         # Create progress popup
         popup = tk.Toplevel(self)
-        popup.title(self.lang.get("processing_title", "Processing"))
+        popup.title(T.processing_title)
         popup.geometry("400x150")
         popup.transient(self)
         popup.grab_set()
@@ -2239,7 +2862,7 @@ class App(ttk.Window):
         # Prevent closing while processing
         popup.protocol("WM_DELETE_WINDOW", lambda: None)
         
-        ttk.Label(popup, text=self.lang.get("processing_warning", "Processing images...")).pack(padx=20, pady=10)
+        ttk.Label(popup, text=T.processing_warning).pack(padx=20, pady=10)
         
         progress = ttk.Progressbar(popup, orient="horizontal", length=350, mode="determinate")
         progress.pack(padx=20, pady=5)
@@ -2256,7 +2879,7 @@ class App(ttk.Window):
         
         cancel_button = ttk.Button(
             popup,
-            text=self.lang.get("cancel", "Cancel"),
+            text=T.cancel,
             command=cancel_processing,
             **self._button_options("danger"),
         )
@@ -2267,14 +2890,26 @@ class App(ttk.Window):
         total_images = len(proj.clothing_images)
         progress["maximum"] = total_images
         
-        # Progress callback for backend
+        # Runs on the worker thread: hand updates to the UI poll, never touch widgets here
+        progress_queue = queue.Queue()
+
         def progress_callback(current, total, message):
             if cancel_requested[0]:
                 return False  # Signal to stop processing
-            progress["value"] = current
-            status_var.set(message)
-            popup.update_idletasks()
+            progress_queue.put((current, message))
             return True
+
+        def drain_progress():
+            latest = None
+            try:
+                while True:
+                    latest = progress_queue.get_nowait()
+            except queue.Empty:
+                pass
+            # Only the newest update is worth drawing
+            if latest is not None and not cancel_requested[0]:
+                progress["value"], message = latest
+                status_var.set(message)
         
         # Processing complete callback
         def processing_complete(future):
@@ -2298,7 +2933,7 @@ class App(ttk.Window):
                     msg = "Issues during processing:\n- " + "\n- ".join(errors[:5])  # Limit to 5 errors
                     if len(errors) > 5:
                         msg += f"\n... and {len(errors) - 5} more errors"
-                    messagebox.showwarning(self.lang.get("warning", "Warning"), msg, parent=self)
+                    messagebox.showwarning(T.warning, msg, parent=self)
                 else:
                     status_var.set("Processing complete!")
                     self.after(1000, popup.destroy)
@@ -2306,41 +2941,38 @@ class App(ttk.Window):
             except Exception as e:
                 popup.destroy()
                 messagebox.showerror(
-                    self.lang.get("error", "Error"),
+                    T.error,
                     f"Processing failed: {str(e)}",
                     parent=self
                 )
         
         # Start async processing
-        future = self.backend.process_project_images_async(idx, progress_callback)
+        future = backend.process_project_images_async(idx, progress_callback)
         
-        # Schedule completion callback
+        # Poll progress and completion from the Tk thread
         def check_future():
+            if not popup.winfo_exists():
+                return
+            drain_progress()
             if future.done():
                 processing_complete(future)
             else:
-                self.after(100, check_future)
+                self.after(50, check_future)
         
-        self.after(100, check_future)
+        self.after(50, check_future)
 
     def ui_remove_image(self, image_index):
         """Remove an image from the current project."""
-        idx = self.backend.get_current_project_index()
-        if idx is None or idx < 0:
-            return
-
-        proj = self.backend.get_project(idx)
+        _, proj = self.backend.get_current_project_and_index()
         
         if not proj or image_index < 0 or image_index >= len(proj.clothing_images):
             return
             
-        proj.clothing_images.pop(image_index)
+        del proj.clothing_images[image_index]
         
-        # Also remove any processed version if it exists
-        processed_images = proj.processed_images.copy()
-        if image_index < len(processed_images):
-            processed_images.pop(image_index)
-        proj.processed_images = processed_images
+        # processed_images is the project's own list; UI handlers only touch it on the Tk thread
+        if image_index < len(proj.processed_images):
+            del proj.processed_images[image_index]
             
         # Reset selection if needed
         if self.selected_processed_index is not None:
@@ -2349,16 +2981,15 @@ class App(ttk.Window):
             elif self.selected_processed_index > image_index:
                 self.selected_processed_index -= 1
         
-        # Force complete refresh of UI
-        self.proc_image_widgets = []
+        # Cells are recycled by index and thumbnails are cached per source image,
+        # so the shifted images reuse existing widgets and PhotoImages
         self.refresh_right_display()
-        
-        self.update_idletasks()
 
     def ui_apply_adjustments(self):
         """Apply adjustment settings to the selected image."""
-        idx = self.backend.get_current_project_index()
-        if idx is None or idx < 0:
+        backend = self.backend
+        idx, proj = backend.get_current_project_and_index()
+        if proj is None:
             return
             
         if self.selected_processed_index is None:
@@ -2376,7 +3007,6 @@ class App(ttk.Window):
         skip_bg_removal = self.skip_bg_removal_var.get()
         use_solid_bg = self.item_use_solid_bg_var.get()
 
-        proj = self.backend.get_project(idx)
         force_reprocess = False
         bg_path = None
 
@@ -2392,7 +3022,7 @@ class App(ttk.Window):
             bg_path = item.get("user_bg_path")
 
         # Apply the adjustments
-        new_image = self.backend.apply_image_adjustments(
+        new_image = backend.apply_image_adjustments(
             idx, self.selected_processed_index,
             vof=vof, 
             hof=hof, 
@@ -2406,10 +3036,7 @@ class App(ttk.Window):
         )
         
         if new_image:
-            target_widget_info = next(
-                (wi for wi in self.proc_image_widgets if wi["index"] == self.selected_processed_index),
-                None
-            )
+            target_widget_info = self.proc_widget_by_index.get(self.selected_processed_index)
 
             if target_widget_info:
                 try:
@@ -2423,7 +3050,7 @@ class App(ttk.Window):
         else:
             # Only show error if we have a valid image selected
             messagebox.showerror(
-                self.lang.get("error", "Error"), 
+                self.T.error, 
                 "Failed to apply adjustments.", 
                 parent=self
             )
@@ -2433,8 +3060,8 @@ class App(ttk.Window):
         idx = self.backend.get_current_project_index()
         if idx is None or idx < 0:
             messagebox.showwarning(
-                self.lang.get("warning", "Warning"), 
-                self.lang.get("no_project", "No project loaded or selected."), 
+                self.T.warning, 
+                self.T.no_project, 
                 parent=self
             )
             return
@@ -2442,66 +3069,62 @@ class App(ttk.Window):
         self._save_current_form_to_backend()
         
         new_description = self.backend.generate_description_for_project(idx)
-        self.desc_text.delete(1.0, tk.END)
-        self.desc_text.insert(tk.END, new_description)
+        # Regenerating with unchanged inputs gives the same text; leave the widget alone then
+        if self.desc_text.get(1.0, "end-1c") != new_description:
+            self.desc_text.delete(1.0, tk.END)
+            self.desc_text.insert(tk.END, new_description)
         
         # Switch to description tab
-        try:
-            desc_tab_id = self.notebook.tabs()[-1]
-            self.notebook.select(desc_tab_id)
-        except Exception:
-            pass
+        tabs = self.notebook.tabs()
+        if tabs:
+            self.notebook.select(tabs[-1])
 
     def ui_copy_description(self):
         """Copy the description to clipboard."""
+        T = self.T
         desc = self.desc_text.get(1.0, tk.END).strip()
         if not desc:
             messagebox.showwarning(
-                self.lang.get("warning", "Warning"), 
-                self.lang.get("copy_empty", "Description is empty."), 
+                T.warning, 
+                T.copy_empty, 
                 parent=self
             )
             return
             
         try:
-            pyperclip.copy(desc)
-        except Exception as e:
+            # Tk owns the selection from here on; no event-loop pass is needed to publish it
+            self.clipboard_clear()
+            self.clipboard_append(desc)
+        except tk.TclError as e:
             messagebox.showerror(
-                self.lang.get("error", "Error"), 
-                f"{self.lang.get('copy_fail', 'Could not copy to clipboard')}:\n{e}", 
+                T.error, 
+                f"{T.copy_fail}:\n{e}", 
                 parent=self
             )
 
     def ui_save_current_project_output(self):
         """Save the current project's processed images and description."""
-        idx = self.backend.get_current_project_index()
-        if idx is None or idx < 0:
-            messagebox.showwarning(
-                self.lang.get("warning", "Warning"),
-                self.lang.get("no_project", "No project loaded or selected."),
-                parent=self
-            )
-            return
-
-        proj = self.backend.get_project(idx)
+        T = self.T
+        backend = self.backend
+        idx, proj = backend.get_current_project_and_index()
         if not proj:
             messagebox.showwarning(
-                self.lang.get("warning", "Warning"), 
-                self.lang.get("no_project", "No project loaded or selected."), 
+                T.warning, 
+                T.no_project, 
                 parent=self
             )
             return
             
         if not proj.processed_images:
             messagebox.showwarning(
-                self.lang.get("warning", "Warning"), 
-                self.lang.get("no_processed_images", "No processed images exist for this project."), 
+                T.warning, 
+                T.no_processed_images, 
                 parent=self
             )
             return
             
         base_folder = filedialog.askdirectory(
-            title=self.lang.get("select_output_base_folder", "Select Folder to Save Project Output"),
+            title=T.select_output_base_folder,
             initialdir=".",
             parent=self
         )
@@ -2514,29 +3137,26 @@ class App(ttk.Window):
         self.config(cursor="watch")
         self.update_idletasks()
         
-        success, output_folder, img_ok, img_err, desc_ok = self.backend.save_project_output(idx, base_folder)
+        success, output_folder, img_ok, img_err, desc_ok = backend.save_project_output(idx, base_folder)
         
         self.config(cursor="")
         
         if success:
             desc_status = "OK" if desc_ok else "Failed"
-            summary = self.lang.get(
-                "save_summary_msg", 
-                "Saved to:\n{folder}\n\nImages OK: {img_ok}\nImages Failed: {img_err}\nDesc Saved: {desc_ok}"
-            ).format(
+            summary = T.save_summary_msg.format(
                 folder=output_folder,
                 img_ok=img_ok,
                 img_err=img_err,
                 desc_ok=desc_status
             )
             messagebox.showinfo(
-                self.lang.get("success", "Success"),
+                T.success,
                 summary,
                 parent=self
             )
         else:
             messagebox.showerror(
-                self.lang.get("error", "Error"), 
+                T.error, 
                 output_folder, 
                 parent=self
             )
@@ -2578,12 +3198,18 @@ class App(ttk.Window):
 
     def _on_editor_close(self):
         """Handle editor window closing."""
+        for key in ("editor_type_filter", "editor_type_tag_filter", "editor_tag_filter", "editor_color_filter"):
+            self._cancel_debounce(key)
         if self.editor_window:
             self.editor_window.destroy()
         self.editor_window = None
         self.type_listbox = None
         self.tag_editor_listbox = None
         self.color_editor_listbox = None
+        # A reopened editor starts with empty forms
+        self._last_selected_type = None
+        self._last_selected_tag = None
+        self._last_selected_color = None
         
     def _on_editor_notebook_tab_changed(self, event):
         """Handle notebook tab change in editor window."""
@@ -2604,34 +3230,33 @@ class App(ttk.Window):
         inner_frame = ttk.Frame(canvas, padding=10)
         inner_frame_id = canvas.create_window((0, 0), window=inner_frame, anchor="nw")
         
-        inner_frame.bind("<Configure>", lambda e: self._update_canvas_scrollregion(canvas))
-        canvas.bind("<Configure>", lambda e: self._update_canvas_itemwidth(canvas, inner_frame_id, e.width))
-        canvas.bind("<Enter>", lambda e: self._bind_mousewheel(canvas))
-        canvas.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        inner_frame.bind("<Configure>", lambda e: self._on_frame_configure(canvas))
+        canvas.bind("<Configure>", lambda e: self._on_canvas_configure(canvas, inner_frame_id))
+        self._register_mousewheel(canvas)
         
         return container, inner_frame
 
     # --- Clothing Types Editor ---
     def _create_clothing_types_editor(self, parent):
         """Create the clothing types editor UI."""
+        T = self.T
         parent.grid_columnconfigure(1, weight=1)
         parent.grid_rowconfigure(1, weight=1)
         
+        # Panels are populated unmapped and gridded once at the end
         # Left panel - type list
         frame_left = ttk.Frame(parent)
-        frame_left.grid(row=0, column=0, rowspan=2, sticky="nsew", padx=(0, 10))
         frame_left.grid_rowconfigure(2, weight=1)
         frame_left.grid_columnconfigure(0, weight=1)
         
-        ttk.Label(frame_left, text=self.lang.get("existing_clothing_types", "Existing Clothing Types:")).grid(row=0, column=0, sticky="w")
+        ttk.Label(frame_left, text=T.existing_clothing_types).grid(row=0, column=0, sticky="w")
         
         # Search field
         self.editor_type_search_var = tk.StringVar()
         type_search_entry = ttk.Entry(frame_left, textvariable=self.editor_type_search_var, width=30)
         type_search_entry.grid(row=1, column=0, sticky="ew", pady=(2, 5))
-        type_search_entry.bind("<KeyRelease>", self._editor_filter_types)
-        type_search_entry.bind("<FocusIn>", lambda e: self._on_entry_focus_in(type_search_entry, self.lang.get("search_placeholder", "Search...")))
-        self._add_placeholder(type_search_entry, self.lang.get("search_placeholder", "Search..."))
+        type_search_entry.bind("<KeyRelease>", lambda e: self._debounce("editor_type_filter", _EDITOR_FILTER_DELAY_MS, self._editor_filter_types, e))
+        self._add_placeholder(type_search_entry, T.search_placeholder)
         
         # Type listbox
         listbox_frame = ttk.Frame(frame_left)
@@ -2645,23 +3270,21 @@ class App(ttk.Window):
         self.type_listbox.grid(row=0, column=0, sticky="nsew")
         type_list_scrollbar.grid(row=0, column=1, sticky="ns")
         self.type_listbox.bind("<<ListboxSelect>>", self._editor_on_type_select)
-        self.type_listbox.bind("<Enter>", lambda e: self._bind_mousewheel(self.type_listbox))
-        self.type_listbox.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        self._register_mousewheel(self.type_listbox)
         
         # Right panel - edit form
         frame_right = ttk.Frame(parent)
-        frame_right.grid(row=0, column=1, rowspan=2, sticky="nsew")
         frame_right.grid_columnconfigure(0, weight=1)
         row_num = 0
         
         # Type name field
-        ttk.Label(frame_right, text=self.lang.get("type_name", "Type Name:")).grid(row=row_num, column=0, sticky="w")
+        ttk.Label(frame_right, text=T.type_name).grid(row=row_num, column=0, sticky="w")
         self.editor_type_name_entry = ttk.Entry(frame_right)
         self.editor_type_name_entry.grid(row=row_num+1, column=0, sticky="ew", pady=(0, 5))
         row_num += 2
         
         # Measurement fields
-        ttk.Label(frame_right, text=self.lang.get("measurement_fields", "Measurement Fields (comma-separated):")).grid(row=row_num, column=0, sticky="w")
+        ttk.Label(frame_right, text=T.measurement_fields).grid(row=row_num, column=0, sticky="w")
         self.editor_fields_entry = ttk.Entry(frame_right)
         self.editor_fields_entry.grid(row=row_num+1, column=0, sticky="ew", pady=(0, 10))
         row_num += 2
@@ -2669,7 +3292,7 @@ class App(ttk.Window):
         # Default tags section
         tags_edit_lframe = ttk.Labelframe(
             frame_right,
-            text=self.lang.get("default_tags", "Default Tags (Auto-selected)"),
+            text=T.default_tags,
             style=self.card_style,
         )
         tags_edit_lframe.grid(row=row_num, column=0, sticky="nsew", pady=(0, 10))
@@ -2681,27 +3304,32 @@ class App(ttk.Window):
         self.editor_type_tag_search_var = tk.StringVar()
         type_tag_search_entry = ttk.Entry(tags_edit_lframe, textvariable=self.editor_type_tag_search_var, width=25)
         type_tag_search_entry.grid(row=0, column=0, sticky="ew", pady=(0, 5))
-        type_tag_search_entry.bind("<KeyRelease>", self._editor_filter_type_tags)
-        type_tag_search_entry.bind("<FocusIn>", lambda e: self._on_entry_focus_in(type_tag_search_entry, self.lang.get("search_placeholder", "Search...")))
-        self._add_placeholder(type_tag_search_entry, self.lang.get("search_placeholder", "Search..."))
+        type_tag_search_entry.bind("<KeyRelease>", lambda e: self._debounce("editor_type_tag_filter", _EDITOR_FILTER_DELAY_MS, self._editor_filter_type_tags, e))
+        self._add_placeholder(type_tag_search_entry, T.search_placeholder)
         
         # Tags scrollable container
         self.editor_type_tags_canvas = tk.Canvas(tags_edit_lframe, borderwidth=0, highlightthickness=0, height=300)
-        type_tags_scroll = ttk.Scrollbar(tags_edit_lframe, orient="vertical", command=self.editor_type_tags_canvas.yview)
-        self.editor_type_tags_canvas.configure(yscrollcommand=type_tags_scroll.set)
+        self.editor_type_tags_scrollbar = ttk.Scrollbar(tags_edit_lframe, orient="vertical", command=self.editor_type_tags_canvas.yview)
+        # Only the rows in view have checkbuttons, so every view change re-renders them
+        self.editor_type_tags_canvas.configure(yscrollcommand=self._on_editor_type_tags_scroll)
         self.editor_type_tags_canvas.grid(row=1, column=0, sticky="nsew")
-        type_tags_scroll.grid(row=1, column=1, sticky="ns")
+        self.editor_type_tags_scrollbar.grid(row=1, column=1, sticky="ns")
         
         # Tags checkboxes container
         self.editor_default_tags_frame = ttk.Frame(self.editor_type_tags_canvas, padding=5)
         self.editor_default_tags_frame_id = self.editor_type_tags_canvas.create_window((0, 0), window=self.editor_default_tags_frame, anchor="nw")
-        self.editor_default_tags_frame.bind("<Configure>", lambda e: self._update_canvas_scrollregion(self.editor_type_tags_canvas))
-        self.editor_type_tags_canvas.bind("<Configure>", lambda e: self._update_canvas_itemwidth(self.editor_type_tags_canvas, self.editor_default_tags_frame_id, e.width))
-        self.editor_type_tags_canvas.bind("<Enter>", lambda e: self._bind_mousewheel(self.editor_type_tags_canvas))
-        self.editor_type_tags_canvas.bind("<Leave>", lambda e: self._unbind_mousewheel())
-        
-        self.editor_type_tag_vars = {}
-        self.editor_type_tag_checkbuttons = {}
+        self.editor_default_tags_frame.bind("<Configure>", lambda e: self._on_frame_configure(self.editor_type_tags_canvas))
+        self.editor_type_tags_canvas.bind("<Configure>", lambda e: self._on_canvas_configure(self.editor_type_tags_canvas, self.editor_default_tags_frame_id))
+        self._register_mousewheel(self.editor_type_tags_canvas)
+        
+        # Checkbuttons are pooled per editor window and recycled across the tag list
+        self._editor_tag_pool = []
+        self._editor_tag_slots = []
+        self._editor_tag_row_h = None
+        self._editor_type_tags_visible = []
+        # Nothing is rendered until the grid is first shown, when the viewport size is known
+        self._editor_type_tags_shown = False
+        self.editor_default_tags_frame.bind("<Map>", self._on_editor_type_tags_map)
         self._editor_rebuild_type_tag_checkboxes([])
         
         # Buttons
@@ -2710,24 +3338,27 @@ class App(ttk.Window):
         
         ttk.Button(
             btn_frame, 
-            text=self.lang.get("add_update_button", "Save"), 
+            text=T.add_update_button, 
             command=self._editor_add_update_type,
             **self._button_options("primary"),
         ).pack(side=tk.LEFT, padx=5)
         
         ttk.Button(
             btn_frame, 
-            text=self.lang.get("delete_button", "Delete"), 
+            text=T.delete_button, 
             command=self._editor_delete_type,
             **self._button_options("danger"),
         ).pack(side=tk.LEFT, padx=5)
         
+        frame_left.grid(row=0, column=0, rowspan=2, sticky="nsew", padx=(0, 10))
+        frame_right.grid(row=0, column=1, rowspan=2, sticky="nsew")
+        
         self._editor_refresh_type_listbox()
 
     def _editor_refresh_type_listbox(self, preserve_selection=True):
         """Refresh the clothing type listbox with filtered items."""
         items = list(self.backend.templates.keys())
-        new_button = self.lang.get("new_button", "New")
+        new_button = self.T.new_button
         self._refresh_listbox_with_search(
             self.type_listbox, 
             self.editor_type_search_var, 
@@ -2753,13 +3384,22 @@ class App(ttk.Window):
             selection = self.type_listbox.curselection()
             
         if not selection:
+            self._last_selected_type = None
             self.editor_type_name_entry.delete(0, tk.END)
             self.editor_fields_entry.delete(0, tk.END)
             self._editor_rebuild_type_tag_checkboxes([])
             return
             
         type_name = self.type_listbox.get(selection[0])
-        if type_name == self.lang.get("new_button", "New"):
+        # Re-selecting the shown type has nothing to redo unless its data or the tag list changed
+        shown = (type_name, self.backend.templates.get(type_name), self.backend.hashtag_version)
+        if shown == self._last_selected_type:
+            if self.editor_window:
+                self.editor_window.lift()
+            return
+        self._last_selected_type = shown
+        
+        if type_name == self.T.new_button:
             self.editor_type_name_entry.delete(0, tk.END)
             self.editor_fields_entry.delete(0, tk.END)
             self._editor_rebuild_type_tag_checkboxes([])
@@ -2781,58 +3421,127 @@ class App(ttk.Window):
             self.editor_window.lift()
 
     def _editor_rebuild_type_tag_checkboxes(self, current_defaults):
-        """Rebuild the tag checkboxes in the clothing type editor."""
-        for widget in self.editor_default_tags_frame.winfo_children():
-            widget.destroy()
-            
-        self.editor_type_tag_vars.clear()
-        self.editor_type_tag_checkbuttons.clear()
-        
-        all_tags = [tag for tag in self.backend.hashtag_mapping.keys() 
-                   if not tag.endswith(" color")]
-        sorted_tags = sorted(all_tags)
-        
-        # Configure the grid
-        cols = 2  # Number of columns
-        self.editor_default_tags_frame.grid_columnconfigure(
-            list(range(cols)), weight=1
-        )
-        
-        row, col = 0, 0
-        for tag in sorted_tags:
-            var = tk.BooleanVar(value=(tag in current_defaults))
-            self.editor_type_tag_vars[tag] = var
-            
-            c = ttk.Checkbutton(self.editor_default_tags_frame, text=tag, variable=var)
-            c.grid(row=row, column=col, sticky="w", padx=2, pady=1)
-            self.editor_type_tag_checkbuttons[tag] = c
-            
-            col = (col + 1) % cols
-            if col == 0:
-                row += 1
-                
-        self.editor_default_tags_frame.update_idletasks()
-        self._update_canvas_scrollregion(self.editor_type_tags_canvas)
-        self.editor_type_tags_canvas.yview_moveto(0)
+        """Show the clothing type editor's default tags with the given ones checked."""
+        self._editor_type_defaults = set(current_defaults)
+        self._editor_type_tags, _ = self._hashtag_partition()
+        # Slots may keep their tag while its checked state changes; False marks
+        # a slot as placed but stale so the next render resyncs or hides it
+        self._editor_tag_slots = [False if slot is not None else None for slot in self._editor_tag_slots]
         
         # Show all tags initially
+        if self._editor_type_tags_shown:
+            self._editor_filter_type_tags()
+
+    def _on_editor_type_tags_map(self, event=None):
+        """Render the default tag checkboxes the first time their frame is mapped."""
+        if self._editor_type_tags_shown:
+            return
+        self._editor_type_tags_shown = True
         self._editor_filter_type_tags()
 
     def _editor_filter_type_tags(self, event=None):
         """Filter default tag checkboxes based on search text."""
-        self._filter_checkbutton_display(
-            self.editor_type_tag_checkbuttons, self.editor_type_tag_search_var,
-            self.editor_default_tags_frame, self.editor_type_tags_canvas,
-            event=event, columns=2,
+        tags = self._editor_type_tags
+        search_term = self.editor_type_tag_search_var.get().strip().lower()
+        if event is None or not search_term or search_term == self._search_placeholder_lc:
+            visible = tags
+        else:
+            sorted_tags, match_index = self._get_search_index(tags)
+            visible = [sorted_tags[i] for i in match_index.find(search_term)]
+        # Keystrokes that leave the matches unchanged (arrows, trailing spaces) need no work
+        if event is not None and visible == self._editor_type_tags_visible:
+            return
+        self._editor_type_tags_visible = visible
+        
+        # Size the frame for every row so the scrollbar reflects the full list
+        rows = -(-len(visible) // 2)
+        self.editor_type_tags_canvas.itemconfigure(
+            self.editor_default_tags_frame_id, height=rows * self._editor_tag_row_height() + 10
         )
+        self._mark_canvas_dirty(self.editor_type_tags_canvas, scroll_to_top=True)
+        self._editor_render_type_tags()
+
+    def _editor_tag_row_height(self):
+        """Return the height of one default tag row, measured from the first pooled checkbutton."""
+        if self._editor_tag_row_h is None:
+            self._editor_grow_tag_pool(2)
+            req = self._editor_tag_pool[0].winfo_reqheight()
+            self._editor_tag_row_h = req + 2 if req > 1 else 24
+        return self._editor_tag_row_h
+
+    def _editor_grow_tag_pool(self, size):
+        """Create pooled default tag checkbuttons until there are at least size of them."""
+        pool = self._editor_tag_pool
+        while len(pool) < size:
+            slot = len(pool)
+            pool.append(ttk.Checkbutton(
+                self.editor_default_tags_frame,
+                command=lambda k=slot: self._editor_toggle_type_tag(k),
+            ))
+            self._editor_tag_slots.append(None)
+
+    def _editor_render_type_tags(self):
+        """Point the pooled checkbuttons at the tags in the visible part of the canvas."""
+        canvas = self.editor_type_tags_canvas
+        if not canvas.winfo_exists():
+            return
+        cols = 2  # Number of columns
+        row_h = self._editor_tag_row_height()
+        view_h = canvas.winfo_height()
+        if view_h <= 1:
+            view_h = int(canvas.cget("height"))
+        # One spare row covers rows cut off at the top and bottom edges
+        self._editor_grow_tag_pool((view_h // row_h + 2) * cols)
+        
+        visible = self._editor_type_tags_visible
+        defaults = self._editor_type_defaults
+        slots = self._editor_tag_slots
+        first = max(0, int(canvas.canvasy(0)) // row_h) * cols
+        for k, cb in enumerate(self._editor_tag_pool):
+            i = first + k
+            old = slots[k]
+            if i >= len(visible):
+                if old is not None:
+                    cb.place_forget()
+                    slots[k] = None
+                continue
+            
+            tag = visible[i]
+            row, col = divmod(i, cols)
+            slot = (tag, tag in defaults, row)
+            if slot == old:
+                continue
+            if not old or old[0] != tag:
+                cb.configure(text=tag)
+            if not old or old[1] != slot[1]:
+                self._set_check_state(cb, slot[1])
+            if not old or old[2] != row:
+                cb.place(relx=col / cols, y=row * row_h, relwidth=1 / cols)
+            slots[k] = slot
+
+    def _on_editor_type_tags_scroll(self, first, last):
+        """Update the scrollbar and re-render the tag slots whenever the canvas view moves."""
+        self.editor_type_tags_scrollbar.set(first, last)
+        self._editor_render_type_tags()
+
+    def _editor_toggle_type_tag(self, slot):
+        """Record a click on a pooled default tag checkbutton."""
+        entry = self._editor_tag_slots[slot]
+        if not entry:
+            return
+        tag, selected, row = entry
+        # The checkbutton has already flipped itself; mirror it without a Tcl variable
+        self._editor_type_defaults ^= {tag}
+        self._editor_tag_slots[slot] = (tag, not selected, row)
 
     def _editor_add_update_type(self):
         """Add or update a clothing type from editor values."""
+        T = self.T
         type_name = self.editor_type_name_entry.get().strip()
         if not type_name:
             messagebox.showwarning(
-                self.lang.get("input_error", "Input Error"), 
-                self.lang.get("type_name_empty", "Type name empty."), 
+                T.input_error, 
+                T.type_name_empty, 
                 parent=self.editor_window
             )
             return
@@ -2840,24 +3549,24 @@ class App(ttk.Window):
         # Parse fields from comma-separated string
         fields = [f.strip() for f in self.editor_fields_entry.get().strip().split(",") if f.strip()]
         
-        selected_def_tags = [tag for tag, var in self.editor_type_tag_vars.items() if var.get()]
-        
-        current_templates = self.backend.templates.copy()
-        current_templates[type_name] = {"fields": fields, "default_tags": selected_def_tags}
+        defaults = self._editor_type_defaults
+        selected_def_tags = [tag for tag in self._editor_type_tags if tag in defaults]
         
-        if self.backend.save_templates_config(current_templates):
-            self._editor_refresh_type_listbox()
-            self._update_clothing_type_options()
-            self.refresh_left_controls_display()
+        template = {"fields": fields, "default_tags": selected_def_tags}
+        # Re-saving identical values needs neither a write nor any refresh
+        unchanged = self.backend.templates.get(type_name) == template
+        if unchanged or self.backend.upsert_template(type_name, template):
+            if not unchanged:
+                self._schedule_refresh("type_listbox", "clothing_types", "left_controls")
             messagebox.showinfo(
-                self.lang.get("success", "Success"),
-                self.lang.get("type_saved_msg", "Type '{type_name}' saved.").format(type_name=type_name),
+                T.success,
+                T.type_saved_msg.format(type_name=type_name),
                 parent=self.editor_window
             )
         else:
             messagebox.showerror(
-                self.lang.get("error", "Error"), 
-                self.lang.get("save_failed", "Save templates failed."), 
+                T.error, 
+                T.save_failed, 
                 parent=self.editor_window
             )
             
@@ -2866,6 +3575,7 @@ class App(ttk.Window):
 
     def _editor_delete_type(self):
         """Delete the selected clothing type."""
+        T = self.T
         if not self.type_listbox:
             return
             
@@ -2874,47 +3584,41 @@ class App(ttk.Window):
             return
             
         type_name = self.type_listbox.get(selection[0])
-        if type_name == self.lang.get("new_button", "New"):
+        if type_name == T.new_button:
             return
             
         # Confirm deletion
-        confirm_msg = self.lang.get(
-            "confirm_delete_type_msg", 
-            "Delete type '{type_name}'?"
-        ).format(type_name=type_name)
+        confirm_msg = T.confirm_delete_type_msg.format(type_name=type_name)
         
         if messagebox.askyesno(
-            self.lang.get("confirm_delete", "Confirm Deletion"), 
+            T.confirm_delete, 
             confirm_msg, 
             parent=self.editor_window
         ):
-            current_templates = self.backend.templates.copy()
-            if type_name in current_templates:
-                del current_templates[type_name]
-                if self.backend.save_templates_config(current_templates):
+            if type_name in self.backend.templates:
+                if self.backend.delete_template(type_name):
+                    self._last_selected_type = None
                     self.editor_type_name_entry.delete(0, tk.END)
                     self.editor_fields_entry.delete(0, tk.END)
                     self._editor_rebuild_type_tag_checkboxes([])
                     
-                    self._editor_refresh_type_listbox()
-                    self._update_clothing_type_options()
-                    self.refresh_left_controls_display()
+                    self._schedule_refresh("type_listbox", "clothing_types", "left_controls")
                     
                     messagebox.showinfo(
-                        self.lang.get("deleted", "Deleted"),
-                        self.lang.get("type_deleted_msg", "Type '{type_name}' deleted.").format(type_name=type_name),
+                        T.deleted,
+                        T.type_deleted_msg.format(type_name=type_name),
                         parent=self.editor_window
                     )
                 else:
                     messagebox.showerror(
-                        self.lang.get("error", "Error"), 
-                        self.lang.get("save_failed", "Save failed."), 
+                        T.error, 
+                        T.save_failed, 
                         parent=self.editor_window
                     )
             else:
                 messagebox.showerror(
-                    self.lang.get("error", "Error"),
-                    self.lang.get("type_not_found_msg", "Type '{type_name}' not found.").format(type_name=type_name),
+                    T.error,
+                    T.type_not_found_msg.format(type_name=type_name),
                     parent=self.editor_window
                 )
                 
@@ -2924,6 +3628,7 @@ class App(ttk.Window):
     # --- Tag Mapping Editor ---
     def _create_tag_mapping_editor(self, parent):
         """Create the tag mapping editor UI."""
+        T = self.T
         parent.grid_columnconfigure(1, weight=1)
         parent.grid_rowconfigure(1, weight=1)
         
@@ -2933,15 +3638,14 @@ class App(ttk.Window):
         frame_left.grid_rowconfigure(2, weight=1)
         frame_left.grid_columnconfigure(0, weight=1)
         
-        ttk.Label(frame_left, text=self.lang.get("existing_tag_mappings", "Existing Tag Mappings:")).grid(row=0, column=0, sticky="w")
+        ttk.Label(frame_left, text=T.existing_tag_mappings).grid(row=0, column=0, sticky="w")
         
         # Search field
         self.editor_tag_search_var = tk.StringVar()
         tag_search_entry = ttk.Entry(frame_left, textvariable=self.editor_tag_search_var, width=30)
         tag_search_entry.grid(row=1, column=0, sticky="ew", pady=(2, 5))
-        tag_search_entry.bind("<KeyRelease>", self._editor_filter_tags)
-        tag_search_entry.bind("<FocusIn>", lambda e: self._on_entry_focus_in(tag_search_entry, self.lang.get("search_placeholder", "Search...")))
-        self._add_placeholder(tag_search_entry, self.lang.get("search_placeholder", "Search..."))
+        tag_search_entry.bind("<KeyRelease>", lambda e: self._debounce("editor_tag_filter", _EDITOR_FILTER_DELAY_MS, self._editor_filter_tags, e))
+        self._add_placeholder(tag_search_entry, T.search_placeholder)
         
         # Tag listbox
         listbox_frame = ttk.Frame(frame_left)
@@ -2955,8 +3659,7 @@ class App(ttk.Window):
         self.tag_editor_listbox.grid(row=0, column=0, sticky="nsew")
         tag_editor_scrollbar.grid(row=0, column=1, sticky="ns")
         self.tag_editor_listbox.bind("<<ListboxSelect>>", self._editor_on_tag_select)
-        self.tag_editor_listbox.bind("<Enter>", lambda e: self._bind_mousewheel(self.tag_editor_listbox))
-        self.tag_editor_listbox.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        self._register_mousewheel(self.tag_editor_listbox)
         
         # Right panel - edit form
         frame_right = ttk.Frame(parent)
@@ -2965,13 +3668,13 @@ class App(ttk.Window):
         row_num = 0
         
         # Tag name field
-        ttk.Label(frame_right, text=self.lang.get("tag", "Tag:")).grid(row=row_num, column=0, sticky="w")
+        ttk.Label(frame_right, text=T.tag).grid(row=row_num, column=0, sticky="w")
         self.editor_tag_entry = ttk.Entry(frame_right)
         self.editor_tag_entry.grid(row=row_num+1, column=0, sticky="ew", pady=(0, 5))
         row_num += 2
         
         # Hashtags field
-        ttk.Label(frame_right, text=self.lang.get("hashtags", "Hashtags (comma-separated):")).grid(row=row_num, column=0, sticky="w")
+        ttk.Label(frame_right, text=T.hashtags).grid(row=row_num, column=0, sticky="w")
         self.editor_hashtags_entry = ttk.Entry(frame_right)
         self.editor_hashtags_entry.grid(row=row_num+1, column=0, sticky="ew", pady=(0, 10))
         row_num += 2
@@ -2982,14 +3685,14 @@ class App(ttk.Window):
         
         ttk.Button(
             btn_frame, 
-            text=self.lang.get("add_update_button", "Save"), 
+            text=T.add_update_button, 
             command=self._editor_add_update_tag,
             **self._button_options("primary"),
         ).pack(side=tk.LEFT, padx=5)
         
         ttk.Button(
             btn_frame, 
-            text=self.lang.get("delete_button", "Delete"), 
+            text=T.delete_button, 
             command=self._editor_delete_tag,
             **self._button_options("danger"),
         ).pack(side=tk.LEFT, padx=5)
@@ -2999,8 +3702,8 @@ class App(ttk.Window):
     def _editor_refresh_tag_listbox(self, preserve_selection=True):
         """Refresh the tag mapping listbox with filtered items."""
         # Only include non-color tags for the tag mappings editor
-        items = [tag for tag in self.backend.hashtag_mapping.keys() if not tag.endswith(" color")]
-        new_button = self.lang.get("new_button", "New")
+        items, _ = self._hashtag_partition()
+        new_button = self.T.new_button
         self._refresh_listbox_with_search(
             self.tag_editor_listbox, 
             self.editor_tag_search_var, 
@@ -3024,12 +3727,21 @@ class App(ttk.Window):
             selection = self.tag_editor_listbox.curselection()
             
         if not selection:
+            self._last_selected_tag = None
             self.editor_tag_entry.delete(0, tk.END)
             self.editor_hashtags_entry.delete(0, tk.END)
             return
             
         tag = self.tag_editor_listbox.get(selection[0])
-        if tag == self.lang.get("new_button", "New"):
+        # Re-selecting the shown tag has nothing to redo unless its hashtags changed
+        shown = (tag, self.backend.hashtag_mapping.get(tag))
+        if shown == self._last_selected_tag:
+            if self.editor_window:
+                self.editor_window.lift()
+            return
+        self._last_selected_tag = shown
+        
+        if tag == self.T.new_button:
             self.editor_tag_entry.delete(0, tk.END)
             self.editor_hashtags_entry.delete(0, tk.END)
         else:
@@ -3046,51 +3758,51 @@ class App(ttk.Window):
 
     def _editor_add_update_tag(self):
         """Add or update a tag mapping from editor values."""
+        T = self.T
         tag = self.editor_tag_entry.get().strip()
         if not tag:
             messagebox.showwarning(
-                self.lang.get("input_error", "Input Error"), 
-                self.lang.get("tag_empty", "Tag empty."), 
+                T.input_error, 
+                T.tag_empty, 
                 parent=self.editor_window
             )
             return
             
         # Parse hashtags from comma-separated string
         hashtags = [
-            h.strip().replace("#", "").replace(" ", "_") 
+            h.strip().translate(_HASHTAG_TRANS) 
             for h in self.editor_hashtags_entry.get().strip().split(",") 
             if h.strip()
         ]
         
         if not hashtags:
             messagebox.showwarning(
-                self.lang.get("input_error", "Input Error"), 
-                self.lang.get("enter_hashtags", "Enter hashtags."), 
+                T.input_error, 
+                T.enter_hashtags, 
                 parent=self.editor_window
             )
             return
             
-        current_mapping = self.backend.hashtag_mapping.copy()
-        current_mapping[tag] = hashtags
-        
-        if self.backend.save_hashtag_mapping_config(current_mapping):
-            self._editor_refresh_tag_listbox()
-            self._create_tag_checkboxes()
-            self.refresh_left_controls_display()
-            
-            # If tags editor is open, refresh its display
-            if hasattr(self, 'editor_default_tags_frame') and self.editor_default_tags_frame.winfo_exists():
-                self._editor_on_type_select()
+        existing = self.backend.hashtag_mapping.get(tag)
+        # Re-saving identical hashtags needs neither a write nor any refresh
+        unchanged = existing == hashtags
+        if unchanged or self.backend.upsert_hashtag_mapping(tag, hashtags):
+            if not unchanged:
+                self._schedule_refresh("tag_listbox")
+            # Widgets elsewhere show tag names only, so just a new tag needs them rebuilt;
+            # the clothing types tab shows the tags too if the editor is open
+            if existing is None:
+                self._schedule_refresh("tag_checkboxes", "left_controls", "type_editor")
                 
             messagebox.showinfo(
-                self.lang.get("success", "Success"),
-                self.lang.get("tag_saved_msg", "Tag '{tag}' saved.").format(tag=tag),
+                T.success,
+                T.tag_saved_msg.format(tag=tag),
                 parent=self.editor_window
             )
         else:
             messagebox.showerror(
-                self.lang.get("error", "Error"), 
-                self.lang.get("save_failed", "Save failed."), 
+                T.error, 
+                T.save_failed, 
                 parent=self.editor_window
             )
             
@@ -3099,6 +3811,7 @@ class App(ttk.Window):
 
     def _editor_delete_tag(self):
         """Delete the selected tag mapping."""
+        T = self.T
         if not self.tag_editor_listbox:
             return
             
@@ -3107,50 +3820,41 @@ class App(ttk.Window):
             return
             
         tag = self.tag_editor_listbox.get(selection[0])
-        if tag == self.lang.get("new_button", "New"):
+        if tag == T.new_button:
             return
             
         # Confirm deletion
-        confirm_msg = self.lang.get(
-            "confirm_delete_tag_msg", 
-            "Delete tag mapping '{tag}'?"
-        ).format(tag=tag)
+        confirm_msg = T.confirm_delete_tag_msg.format(tag=tag)
         
         if messagebox.askyesno(
-            self.lang.get("confirm_delete", "Confirm Deletion"), 
+            T.confirm_delete, 
             confirm_msg, 
             parent=self.editor_window
         ):
-            current_mapping = self.backend.hashtag_mapping.copy()
-            if tag in current_mapping:
-                del current_mapping[tag]
-                if self.backend.save_hashtag_mapping_config(current_mapping):
+            if tag in self.backend.hashtag_mapping:
+                if self.backend.delete_hashtag_mapping(tag):
+                    self._last_selected_tag = None
                     self.editor_tag_entry.delete(0, tk.END)
                     self.editor_hashtags_entry.delete(0, tk.END)
                     
-                    self._editor_refresh_tag_listbox()
-                    self._create_tag_checkboxes()
-                    self.refresh_left_controls_display()
-                    
                     # If clothing types editor is open, refresh it too
-                    if hasattr(self, 'editor_default_tags_frame') and self.editor_default_tags_frame.winfo_exists():
-                        self._editor_on_type_select()
+                    self._schedule_refresh("tag_listbox", "tag_checkboxes", "left_controls", "type_editor")
                         
                     messagebox.showinfo(
-                        self.lang.get("deleted", "Deleted"),
-                        self.lang.get("tag_deleted_msg", "Tag '{tag}' deleted.").format(tag=tag),
+                        T.deleted,
+                        T.tag_deleted_msg.format(tag=tag),
                         parent=self.editor_window
                     )
                 else:
                     messagebox.showerror(
-                        self.lang.get("error", "Error"), 
-                        self.lang.get("save_failed", "Save failed."), 
+                        T.error, 
+                        T.save_failed, 
                         parent=self.editor_window
                     )
             else:
                 messagebox.showerror(
-                    self.lang.get("error", "Error"),
-                    self.lang.get("tag_not_found_msg", "Tag '{tag}' not found.").format(tag=tag),
+                    T.error,
+                    T.tag_not_found_msg.format(tag=tag),
                     parent=self.editor_window
                 )
                 
@@ -3160,6 +3864,7 @@ class App(ttk.Window):
     # --- Colors Editor ---
     def _create_colors_editor(self, parent):
         """Create the colors editor UI."""
+        T = self.T
         parent.grid_columnconfigure(1, weight=1)
         parent.grid_rowconfigure(1, weight=1)
         
@@ -3169,15 +3874,14 @@ class App(ttk.Window):
         frame_left.grid_rowconfigure(2, weight=1)
         frame_left.grid_columnconfigure(0, weight=1)
         
-        ttk.Label(frame_left, text=self.lang.get("existing_color_mappings", "Existing Color Mappings:")).grid(row=0, column=0, sticky="w")
+        ttk.Label(frame_left, text=T.existing_color_mappings).grid(row=0, column=0, sticky="w")
         
         # Search field
         self.editor_color_search_var = tk.StringVar()
         color_search_entry = ttk.Entry(frame_left, textvariable=self.editor_color_search_var, width=30)
         color_search_entry.grid(row=1, column=0, sticky="ew", pady=(2, 5))
-        color_search_entry.bind("<KeyRelease>", self._editor_filter_colors)
-        color_search_entry.bind("<FocusIn>", lambda e: self._on_entry_focus_in(color_search_entry, self.lang.get("search_placeholder", "Search...")))
-        self._add_placeholder(color_search_entry, self.lang.get("search_placeholder", "Search..."))
+        color_search_entry.bind("<KeyRelease>", lambda e: self._debounce("editor_color_filter", _EDITOR_FILTER_DELAY_MS, self._editor_filter_colors, e))
+        self._add_placeholder(color_search_entry, T.search_placeholder)
         
         # Color listbox
         listbox_frame = ttk.Frame(frame_left)
@@ -3191,8 +3895,7 @@ class App(ttk.Window):
         self.color_editor_listbox.grid(row=0, column=0, sticky="nsew")
         color_editor_scrollbar.grid(row=0, column=1, sticky="ns")
         self.color_editor_listbox.bind("<<ListboxSelect>>", self._editor_on_color_select)
-        self.color_editor_listbox.bind("<Enter>", lambda e: self._bind_mousewheel(self.color_editor_listbox))
-        self.color_editor_listbox.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        self._register_mousewheel(self.color_editor_listbox)
         
         # Right panel - edit form
         frame_right = ttk.Frame(parent)
@@ -3201,19 +3904,19 @@ class App(ttk.Window):
         row_num = 0
         
         # Color name field
-        ttk.Label(frame_right, text=self.lang.get("color_label", "Color:")).grid(row=row_num, column=0, sticky="w")
+        ttk.Label(frame_right, text=T.color_label).grid(row=row_num, column=0, sticky="w")
         self.editor_color_entry = ttk.Entry(frame_right)
         self.editor_color_entry.grid(row=row_num+1, column=0, sticky="ew", pady=(0, 5))
         row_num += 2
         
         # Color hashtags field
-        ttk.Label(frame_right, text=self.lang.get("color_hashtags_label", "Color Hashtags (comma separated):")).grid(row=row_num, column=0, sticky="w")
+        ttk.Label(frame_right, text=T.color_hashtags_label).grid(row=row_num, column=0, sticky="w")
         self.editor_color_hashtags_entry = ttk.Entry(frame_right)
         self.editor_color_hashtags_entry.grid(row=row_num+1, column=0, sticky="ew", pady=(0, 10))
         row_num += 2
         
         # Color preview swatch
-        ttk.Label(frame_right, text=self.lang.get("color_preview", "Color Preview:")).grid(row=row_num, column=0, sticky="w")
+        ttk.Label(frame_right, text=T.color_preview).grid(row=row_num, column=0, sticky="w")
         
         self.editor_color_preview = tk.Canvas(frame_right, width=100, height=30, background="#cccccc", bd=1, relief="solid")
         self.editor_color_preview.grid(row=row_num+1, column=0, sticky="w", pady=(0, 10))
@@ -3225,14 +3928,14 @@ class App(ttk.Window):
         
         ttk.Button(
             btn_frame, 
-            text=self.lang.get("add_update_button", "Save"), 
+            text=T.add_update_button, 
             command=self._editor_add_update_color,
             **self._button_options("primary"),
         ).pack(side=tk.LEFT, padx=5)
         
         ttk.Button(
             btn_frame, 
-            text=self.lang.get("delete_button", "Delete"), 
+            text=T.delete_button, 
             command=self._editor_delete_color,
             **self._button_options("danger"),
         ).pack(side=tk.LEFT, padx=5)
@@ -3242,8 +3945,8 @@ class App(ttk.Window):
     def _editor_refresh_color_listbox(self, preserve_selection=True):
         """Refresh the color listbox with filtered items."""
         # Only include color mappings (keys ending with " color")
-        items = [tag for tag in self.backend.hashtag_mapping.keys() if tag.endswith(" color")]
-        new_button = self.lang.get("new_button", "New")
+        _, items = self._hashtag_partition()
+        new_button = self.T.new_button
         self._refresh_listbox_with_search(
             self.color_editor_listbox, 
             self.editor_color_search_var, 
@@ -3267,13 +3970,22 @@ class App(ttk.Window):
             selection = self.color_editor_listbox.curselection()
                 
         if not selection:
+            self._last_selected_color = None
             self.editor_color_entry.delete(0, tk.END)
             self.editor_color_hashtags_entry.delete(0, tk.END)
             self.editor_color_preview.config(background="#ffffff")
             return
                 
         color_tag = self.color_editor_listbox.get(selection[0])
-        if color_tag == self.lang.get("new_button", "New"):
+        # Re-selecting the shown color has nothing to redo unless its hashtags changed
+        shown = (color_tag, self.backend.hashtag_mapping.get(color_tag))
+        if shown == self._last_selected_color:
+            if self.editor_window:
+                self.editor_window.lift()
+            return
+        self._last_selected_color = shown
+        
+        if color_tag == self.T.new_button:
             self.editor_color_entry.delete(0, tk.END)
             self.editor_color_hashtags_entry.delete(0, tk.END)
             self.editor_color_preview.config(background="#ffffff")
@@ -3287,7 +3999,11 @@ class App(ttk.Window):
             self.editor_color_hashtags_entry.delete(0, tk.END)
             self.editor_color_hashtags_entry.insert(tk.END, ", ".join(hashtags))
             
-            preview_color = self._get_color_from_name(display_name)
+            swatch_cb = self.color_checkbuttons.get(color_tag)
+            if swatch_cb is not None:
+                preview_color = swatch_cb.master.swatch_hex
+            else:
+                preview_color = _color_from_name(display_name)
             self.editor_color_preview.config(background=preview_color)
                 
         if self.editor_window:
@@ -3295,11 +4011,12 @@ class App(ttk.Window):
 
     def _editor_add_update_color(self):
         """Add or update a color from editor values."""
+        T = self.T
         color_name = self.editor_color_entry.get().strip()
         if not color_name:
             messagebox.showwarning(
-                self.lang.get("input_error", "Input Error"), 
-                self.lang.get("color_name_empty", "Color name empty."), 
+                T.input_error, 
+                T.color_name_empty, 
                 parent=self.editor_window
             )
             return
@@ -3308,36 +4025,38 @@ class App(ttk.Window):
         
         # Parse hashtags from comma-separated string
         hashtags = [
-            h.strip().replace("#", "").replace(" ", "_") 
+            h.strip().translate(_HASHTAG_TRANS) 
             for h in self.editor_color_hashtags_entry.get().strip().split(",") 
             if h.strip()
         ]
         
         if not hashtags:
             messagebox.showwarning(
-                self.lang.get("input_error", "Input Error"), 
-                self.lang.get("enter_hashtags", "Enter hashtags."), 
+                T.input_error, 
+                T.enter_hashtags, 
                 parent=self.editor_window
             )
             return
             
-        current_mapping = self.backend.hashtag_mapping.copy()
-        current_mapping[color_tag] = hashtags
-        
-        if self.backend.save_hashtag_mapping_config(current_mapping):
-            self._editor_refresh_color_listbox()
-            self._create_color_checkboxes()
-            self.refresh_left_controls_display()
+        existing = self.backend.hashtag_mapping.get(color_tag)
+        # Re-saving identical hashtags needs neither a write nor any refresh
+        unchanged = existing == hashtags
+        if unchanged or self.backend.upsert_hashtag_mapping(color_tag, hashtags):
+            if not unchanged:
+                self._schedule_refresh("color_listbox")
+            # The main window lists color names only, so editing hashtags leaves it unchanged
+            if existing is None:
+                self._schedule_refresh("color_checkboxes", "left_controls")
                 
             messagebox.showinfo(
-                self.lang.get("success", "Success"),
-                self.lang.get("color_saved_msg", "Color '{color_name}' saved.").format(color_name=color_name),
+                T.success,
+                T.color_saved_msg.format(color_name=color_name),
                 parent=self.editor_window
             )
         else:
             messagebox.showerror(
-                self.lang.get("error", "Error"), 
-                self.lang.get("save_failed", "Save failed."), 
+                T.error, 
+                T.save_failed, 
                 parent=self.editor_window
             )
                 
@@ -3346,6 +4065,7 @@ class App(ttk.Window):
 
     def _editor_delete_color(self):
         """Delete the selected color."""
+        T = self.T
         if not hasattr(self, 'color_editor_listbox') or not self.color_editor_listbox:
             return
                 
@@ -3354,48 +4074,42 @@ class App(ttk.Window):
             return
                 
         color_tag = self.color_editor_listbox.get(selection[0])
-        if color_tag == self.lang.get("new_button", "New"):
+        if color_tag == T.new_button:
             return
                 
         color_name = color_tag.replace(" color", "")
         
         # Confirm deletion
-        confirm_msg = self.lang.get(
-            "confirm_delete_color", 
-            "Delete color '{color_name}'?"
-        ).format(color_name=color_name)
+        confirm_msg = T.confirm_delete_color.format(color_name=color_name)
         
         if messagebox.askyesno(
-            self.lang.get("confirm_delete", "Confirm Deletion"), 
+            T.confirm_delete, 
             confirm_msg, 
             parent=self.editor_window
         ):
-            current_mapping = self.backend.hashtag_mapping.copy()
-            if color_tag in current_mapping:
-                del current_mapping[color_tag]
-                if self.backend.save_hashtag_mapping_config(current_mapping):
+            if color_tag in self.backend.hashtag_mapping:
+                if self.backend.delete_hashtag_mapping(color_tag):
+                    self._last_selected_color = None
                     self.editor_color_entry.delete(0, tk.END)
                     self.editor_color_hashtags_entry.delete(0, tk.END)
                     
-                    self._editor_refresh_color_listbox()
-                    self._create_color_checkboxes()
-                    self.refresh_left_controls_display()
+                    self._schedule_refresh("color_listbox", "color_checkboxes", "left_controls")
                         
                     messagebox.showinfo(
-                        self.lang.get("deleted", "Deleted"),
-                        self.lang.get("color_deleted_msg", "Color '{color_name}' deleted.").format(color_name=color_name),
+                        T.deleted,
+                        T.color_deleted_msg.format(color_name=color_name),
                         parent=self.editor_window
                     )
                 else:
                     messagebox.showerror(
-                        self.lang.get("error", "Error"), 
-                        self.lang.get("save_failed", "Save failed."), 
+                        T.error, 
+                        T.save_failed, 
                         parent=self.editor_window
                     )
             else:
                 messagebox.showerror(
-                    self.lang.get("error", "Error"),
-                    self.lang.get("color_not_found", "Color '{color_name}' not found.").format(color_name=color_name),
+                    T.error,
+                    T.color_not_found.format(color_name=color_name),
                     parent=self.editor_window
                 )
                     
@@ -3405,6 +4119,7 @@ class App(ttk.Window):
     # --- Backgrounds Editor ---
     def _create_backgrounds_editor(self, parent):
         """Create the backgrounds editor UI."""
+        T = self.T
         parent.grid_columnconfigure(0, weight=1)
         parent.grid_rowconfigure(3, weight=1)
         row_num = 0
@@ -3412,7 +4127,7 @@ class App(ttk.Window):
         # Help text
         ttk.Label(
             parent, 
-            text=self.lang.get("bg_folder_info", "Backgrounds are stored in the 'bg' folder next to the application")
+            text=T.bg_folder_info
         ).grid(row=row_num, column=0, sticky="w", pady=(0, 10))
         row_num += 1
 
@@ -3422,14 +4137,14 @@ class App(ttk.Window):
         
         ttk.Button(
             actions_frame, 
-            text=self.lang.get("open_bg_folder_button", "Open Background Folder"), 
+            text=T.open_bg_folder_button, 
             command=self._open_background_folder_native,
             **self._button_options("secondary"),
         ).grid(row=0, column=0, padx=(0, 10))
         
         ttk.Button(
             actions_frame, 
-            text=self.lang.get("refresh_bg_list", "Refresh List"), 
+            text=T.refresh_bg_list, 
             command=self._editor_refresh_bg_listbox,
             **self._button_options("link"),
         ).grid(row=0, column=1)
@@ -3437,12 +4152,12 @@ class App(ttk.Window):
         # Note about solid background
         ttk.Label(
             parent, 
-            text=self.lang.get("solid_bg_note", "Note: The 'Use solid background color' option is available in the main interface.")
+            text=T.solid_bg_note
         ).grid(row=row_num, column=0, sticky="w", pady=(0, 10))
         row_num += 1
         
         # Background list
-        ttk.Label(parent, text=self.lang.get("loaded_backgrounds", "Loaded Backgrounds:")).grid(
+        ttk.Label(parent, text=T.loaded_backgrounds).grid(
             row=row_num, column=0, sticky="w"
         )
         row_num += 1
@@ -3457,8 +4172,7 @@ class App(ttk.Window):
         self.editor_bg_listbox.configure(yscrollcommand=bg_scroll.set)
         self.editor_bg_listbox.grid(row=0, column=0, sticky="nsew")
         bg_scroll.grid(row=0, column=1, sticky="ns")
-        self.editor_bg_listbox.bind("<Enter>", lambda e: self._bind_mousewheel(self.editor_bg_listbox))
-        self.editor_bg_listbox.bind("<Leave>", lambda e: self._unbind_mousewheel())
+        self._register_mousewheel(self.editor_bg_listbox)
         
         row_num += 1
         
@@ -3467,27 +4181,41 @@ class App(ttk.Window):
         
         ttk.Button(
             remove_frame,
-            text=self.lang.get("remove_selected_bg", "Remove Selected"),
+            text=T.remove_selected_bg,
             command=self._editor_remove_selected_background,
             **self._button_options("danger"),
         ).pack(side=tk.LEFT)
         
-        # Populate the listbox
+        # The folder is scanned the first time the tab is shown, not while the editor opens
+        self._editor_bg_loaded = False
+        self.editor_bg_listbox.bind("<Map>", self._on_editor_bg_listbox_map)
+
+    def _on_editor_bg_listbox_map(self, event=None):
+        """Populate the background listbox the first time it is mapped."""
+        if self._editor_bg_loaded:
+            return
+        self._editor_bg_loaded = True
         self._editor_refresh_bg_listbox()
 
-    def _editor_refresh_bg_listbox(self):
-        """Refresh the background listbox with current backgrounds."""
+    def _editor_refresh_bg_listbox(self, rescan=True):
+        """Refresh the background listbox, rescanning the folder unless the backend list is current."""
         if not hasattr(self, 'editor_bg_listbox') or not self.editor_bg_listbox.winfo_exists():
             return
-            
-        self.editor_bg_listbox.delete(0, tk.END)
         
-        # Refresh the backend backgrounds list
-        self.backend.scan_backgrounds_folder()
-        
-        # Show basenames in the listbox for better readability
-        for path in self.backend.backgrounds:
-            self.editor_bg_listbox.insert(tk.END, os.path.basename(path))
+        # Files may be added to the folder outside the app, so opening the
+        # editor and the Refresh button rescan; in-app removals don't need to
+        if rescan:
+            self.backend.scan_backgrounds_folder()
+        
+        # Show basenames in the listbox for better readability; the mapping resolves
+        # a selected row back to its file without rescanning the list. The library
+        # builds every path with os.path.join, so the name follows the last os.sep
+        sep = os.sep
+        self._editor_bg_paths = {path.rpartition(sep)[2]: path for path in self.backend.backgrounds}
+        # Rows that didn't change keep their selection and scroll position
+        self._sync_listbox_items(self.editor_bg_listbox, list(self._editor_bg_paths))
+        # The arrows depend on how many backgrounds exist; a batch of changes resyncs them once
+        self._schedule_refresh("bg_indicators")
 
     def _open_background_folder_native(self):
         """Open the background folder in the user's native file explorer."""
@@ -3502,8 +4230,8 @@ class App(ttk.Window):
                 subprocess.run(["xdg-open", folder], check=False)
         except Exception as exc:
             messagebox.showerror(
-                self.lang.get("error", "Error"),
-                self.lang.get("open_bg_folder_error", "Could not open background folder:\n{error}").format(error=exc),
+                self.T.error,
+                self.T.open_bg_folder_error.format(error=exc),
                 parent=self,
             )
 
@@ -3524,10 +4252,11 @@ class App(ttk.Window):
 
     def _editor_remove_selected_background(self):
         """Remove the selected background file."""
+        T = self.T
         selection = self.editor_bg_listbox.curselection()
         if not selection:
             messagebox.showinfo(
-                self.lang.get("info", "Info"), 
+                T.info, 
                 "Please select a background to remove.", 
                 parent=self.editor_window
             )
@@ -3535,16 +4264,11 @@ class App(ttk.Window):
             
         basename = self.editor_bg_listbox.get(selection[0])
         
-        # Find the full path in the backend.backgrounds list
-        full_path = None
-        for path in self.backend.backgrounds:
-            if os.path.basename(path) == basename:
-                full_path = path
-                break
+        full_path = self._editor_bg_paths.get(basename)
                 
         if not full_path:
             messagebox.showerror(
-                self.lang.get("error", "Error"), 
+                T.error, 
                 "Unable to find the selected background file.", 
                 parent=self.editor_window
             )
@@ -3552,25 +4276,24 @@ class App(ttk.Window):
             
         # Confirm deletion
         if messagebox.askyesno(
-            self.lang.get("confirm_delete", "Confirm Deletion"),
+            T.confirm_delete,
             f"Remove background '{basename}'?\nThis will delete the file from disk.",
             parent=self.editor_window
         ):
             # Call backend to remove the file
-            success, error_msg = self.backend.remove_bg_file(full_path)
-            
-            if success:
-                self._editor_refresh_bg_listbox()
+            if self.backend.remove_bg_file(full_path):
+                # The backend already dropped the path from its list
+                self._editor_refresh_bg_listbox(rescan=False)
                 self.refresh_right_display()
                 messagebox.showinfo(
-                    self.lang.get("success", "Success"), 
+                    T.success, 
                     f"Background '{basename}' removed.", 
                     parent=self.editor_window
                 )
             else:
                 messagebox.showerror(
-                    self.lang.get("error", "Error"), 
-                    f"Failed to remove background: {error_msg}", 
+                    T.error, 
+                    f"Failed to remove background '{basename}'.", 
                     parent=self.editor_window
                 )
         
@@ -3580,58 +4303,62 @@ class App(ttk.Window):
     # --- General Settings Editor ---
     def _create_general_settings_editor(self, parent):
         """Create the general settings editor UI."""
+        lang = self.lang
+        T = self.T
+        backend = self.backend
         parent.grid_columnconfigure(1, weight=1)
         row_num = 0
         
         # Language selector
-        ttk.Label(parent, text=self.lang.get("language_label", "Language (Requires Restart):")).grid(
+        ttk.Label(parent, text=T.language_label).grid(
             row=row_num, column=0, sticky="w", padx=(0, 5), pady=5
         )
         
-        self.editor_lang_var = tk.StringVar(value=self.backend.selected_language_code)
-        lang_options = self.backend.get_available_languages()
-        lang_dict = dict(lang_options)
+        self.editor_lang_var = tk.StringVar(value=backend.selected_language_code)
+        # The language files are only read when the dropdown is first opened
+        current_code = backend.selected_language_code
+        current_display_name = lang.get("language_name", current_code)
 
         self.editor_lang_combo = ttk.Combobox(
             parent,
             textvariable=self.editor_lang_var,
-            values=[name for code, name in lang_options],
+            values=[current_display_name],
             state="readonly",
-            width=30
+            width=30,
+            postcommand=self._editor_load_language_options,
         )
 
-        current_display_name = lang_dict.get(
-            self.backend.selected_language_code,
-            lang_dict.get("en", "?")
-        )
         self.editor_lang_combo.set(current_display_name)
         self.editor_lang_combo.grid(row=row_num, column=1, sticky="w", pady=5)
         row_num += 1
         
-        self.editor_lang_display_to_code = {name: code for code, name in lang_options}
+        self.editor_lang_display_to_code = {current_display_name: current_code}
         
         # Units selector
-        ttk.Label(parent, text=self.lang.get("units", "Units:")).grid(
+        ttk.Label(parent, text=T.units).grid(
             row=row_num, column=0, sticky="w", padx=(0, 5), pady=5
         )
-        self.editor_units_entry = ttk.Entry(parent, width=10)
+        self.editor_units_var = tk.StringVar(value=backend.units)
+        self.editor_units_entry = ttk.Entry(parent, width=10, textvariable=self.editor_units_var)
         self.editor_units_entry.grid(row=row_num, column=1, sticky="w", pady=5)
-        self.editor_units_entry.insert(tk.END, self.backend.units)
         row_num += 1
         
         # Output filename prefix
-        ttk.Label(parent, text=self.lang.get("output_prefix", "Output Filename Prefix:")).grid(
+        ttk.Label(parent, text=T.output_prefix).grid(
             row=row_num, column=0, sticky="w", padx=(0, 5), pady=5
         )
-        self.editor_output_prefix_entry = ttk.Entry(parent)
+        self.editor_output_prefix_var = tk.StringVar(value=backend.output_prefix)
+        self.editor_output_prefix_entry = ttk.Entry(parent, textvariable=self.editor_output_prefix_var)
         self.editor_output_prefix_entry.grid(row=row_num, column=1, sticky="ew", pady=5)
-        self.editor_output_prefix_entry.insert(tk.END, self.backend.output_prefix)
         row_num += 1
         
+        # Canvas dimensions only accept digits, so saving can't hit a bad value
+        int_vcmd = (parent.register(self._is_digit_text), "%P")
+        
         # Canvas dimensions section
         canvas_dimensions = ttk.Labelframe(
             parent,
-            text=self.lang.get("canvas_dimensions", "Canvas Dimensions"),
+            text=T.canvas_dimensions,
             style=self.card_style,
         )
         canvas_dimensions.grid(row=row_num, column=0, columnspan=2, sticky="ew", pady=10)
@@ -3642,42 +4369,54 @@ class App(ttk.Window):
         # Vertical canvas settings
         ttk.Label(
             canvas_dimensions, 
-            text=self.lang.get("vertical_canvas", "Vertical Canvas (Recommended: 600x800):")
+            text=T.vertical_canvas
         ).grid(row=0, column=0, sticky="w", pady=(0, 5), columnspan=4)
         
-        ttk.Label(canvas_dimensions, text=self.lang.get("width", "Width:")).grid(
+        ttk.Label(canvas_dimensions, text=T.width).grid(
             row=1, column=0, sticky="w", padx=(5, 5)
         )
-        self.editor_v_width_entry = ttk.Entry(canvas_dimensions, width=8)
+        self.editor_v_width_var = tk.StringVar(value=str(backend.canvas_width_v))
+        self.editor_v_width_entry = ttk.Entry(
+            canvas_dimensions, width=8, textvariable=self.editor_v_width_var,
+            validate="key", validatecommand=int_vcmd,
+        )
         self.editor_v_width_entry.grid(row=1, column=1, sticky="w", padx=(0, 20))
-        self.editor_v_width_entry.insert(tk.END, str(self.backend.canvas_width_v))
         
-        ttk.Label(canvas_dimensions, text=self.lang.get("height", "Height:")).grid(
+        ttk.Label(canvas_dimensions, text=T.height).grid(
             row=1, column=2, sticky="w", padx=(0, 5)
         )
-        self.editor_v_height_entry = ttk.Entry(canvas_dimensions, width=8)
+        self.editor_v_height_var = tk.StringVar(value=str(backend.canvas_height_v))
+        self.editor_v_height_entry = ttk.Entry(
+            canvas_dimensions, width=8, textvariable=self.editor_v_height_var,
+            validate="key", validatecommand=int_vcmd,
+        )
         self.editor_v_height_entry.grid(row=1, column=3, sticky="w")
-        self.editor_v_height_entry.insert(tk.END, str(self.backend.canvas_height_v))
         
         # Horizontal canvas settings
         ttk.Label(
             canvas_dimensions, 
-            text=self.lang.get("horizontal_canvas", "Horizontal Canvas (Recommended: 800x600):")
+            text=T.horizontal_canvas
         ).grid(row=2, column=0, sticky="w", pady=(10, 5), columnspan=4)
         
-        ttk.Label(canvas_dimensions, text=self.lang.get("width", "Width:")).grid(
+        ttk.Label(canvas_dimensions, text=T.width).grid(
             row=3, column=0, sticky="w", padx=(5, 5)
         )
-        self.editor_h_width_entry = ttk.Entry(canvas_dimensions, width=8)
+        self.editor_h_width_var = tk.StringVar(value=str(backend.canvas_width_h))
+        self.editor_h_width_entry = ttk.Entry(
+            canvas_dimensions, width=8, textvariable=self.editor_h_width_var,
+            validate="key", validatecommand=int_vcmd,
+        )
         self.editor_h_width_entry.grid(row=3, column=1, sticky="w", padx=(0, 20))
-        self.editor_h_width_entry.insert(tk.END, str(self.backend.canvas_width_h))
         
-        ttk.Label(canvas_dimensions, text=self.lang.get("height", "Height:")).grid(
+        ttk.Label(canvas_dimensions, text=T.height).grid(
             row=3, column=2, sticky="w", padx=(0, 5)
         )
-        self.editor_h_height_entry = ttk.Entry(canvas_dimensions, width=8)
+        self.editor_h_height_var = tk.StringVar(value=str(backend.canvas_height_h))
+        self.editor_h_height_entry = ttk.Entry(
+            canvas_dimensions, width=8, textvariable=self.editor_h_height_var,
+            validate="key", validatecommand=int_vcmd,
+        )
         self.editor_h_height_entry.grid(row=3, column=3, sticky="w")
-        self.editor_h_height_entry.insert(tk.END, str(self.backend.canvas_height_h))
         
         save_btn_frame = ttk.Frame(parent, style=self.panel_style)
         save_btn_frame.grid(row=row_num, column=0, columnspan=2, sticky="ew", pady=20)
@@ -3685,45 +4424,63 @@ class App(ttk.Window):
         
         ttk.Button(
             save_btn_frame,
-            text=self.lang.get("save_all_settings", "Save All Settings"),
+            text=T.save_all_settings,
             command=self._editor_save_all_settings,
             **self._button_options("primary"),
         ).grid(row=0, column=1, sticky="e")
 
+    def _editor_load_language_options(self):
+        """Fill the language dropdown from the language files the first time it opens."""
+        lang_options = self.backend.get_available_languages()
+        self.editor_lang_display_to_code.update({name: code for code, name in lang_options})
+        self.editor_lang_combo.configure(
+            values=[name for code, name in lang_options], postcommand=""
+        )
+
+    @staticmethod
+    def _is_digit_text(text):
+        """Entry validator accepting only ASCII digits or an empty field."""
+        return text == "" or (text.isascii() and text.isdigit())
+
     def _editor_save_all_settings(self):
         """Save all general settings."""
+        T = self.T
         current_config = self.backend.config_data.copy()
         
         selected_display_name = self.editor_lang_var.get()
         selected_lang_code = self.editor_lang_display_to_code.get(selected_display_name, "en")
         current_config["selected_language"] = selected_lang_code
         
-        current_config["units"] = self.editor_units_entry.get().strip() or "cm"
-        current_config["output_prefix"] = self.editor_output_prefix_entry.get().strip() or "mla_"
+        current_config["units"] = self.editor_units_var.get().strip() or "cm"
+        current_config["output_prefix"] = self.editor_output_prefix_var.get().strip() or "mla_"
         
-        try:
-            current_config["canvas_width_v"] = int(self.editor_v_width_entry.get().strip())
-            current_config["canvas_height_v"] = int(self.editor_v_height_entry.get().strip())
-            current_config["canvas_width_h"] = int(self.editor_h_width_entry.get().strip())
-            current_config["canvas_height_h"] = int(self.editor_h_height_entry.get().strip())
-        except ValueError:
+        dimensions = {
+            "canvas_width_v": self.editor_v_width_var.get(),
+            "canvas_height_v": self.editor_v_height_var.get(),
+            "canvas_width_h": self.editor_h_width_var.get(),
+            "canvas_height_h": self.editor_h_height_var.get(),
+        }
+        # The entries only accept digits, so an empty field is the only invalid value left
+        if not all(dimensions.values()):
             messagebox.showwarning(
-                self.lang.get("input_error", "Input Error"),
-                self.lang.get("canvas_dimensions_error", "Canvas dimensions must be integers."),
+                T.input_error,
+                T.canvas_dimensions_error,
                 parent=self.editor_window
             )
             return
+        for key, value in dimensions.items():
+            current_config[key] = int(value)
         
         if self.backend.save_main_config(current_config):
             messagebox.showinfo(
-                self.lang.get("success", "Success"), 
-                self.lang.get("settings_saved", "Settings saved. Restart application to apply language change."), 
+                T.success, 
+                T.settings_saved, 
                 parent=self.editor_window
             )
         else:
             messagebox.showerror(
-                self.lang.get("error", "Error"), 
-                self.lang.get("save_failed", "Failed to save settings."), 
+                T.error, 
+                T.save_failed, 
                 parent=self.editor_window
             )
             